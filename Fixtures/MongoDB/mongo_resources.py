@@ -6,8 +6,12 @@ from typing import Dict, List, Any, Optional
 from typing_extensions import TypedDict
 from Configs.MongoConfig import syncMongoClient
 from pymongo.errors import CollectionInvalid
+from pymongo.write_concern import WriteConcern
 from Fixtures.base_fixture import DEBenchFixture
 
+# Seed data is recreated on every setup, so skip waiting on the journal
+_SEED_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
 
 # Type definitions for MongoDB resources
 class MongoCollectionConfig(TypedDict):
@@ -81,25 +85,34 @@ class MongoDBFixture(
 
                 # Process collections in this database
                 if "collections" in db_config:
+                    # One round trip to find stale collections instead of a
+                    # failed create_collection per collection
+                    existing = set(db.list_collection_names())
+
                     for collection_config in db_config["collections"]:
                         collection_name = collection_config["name"]
 
-                        # Create collection with error handling
-                        try:
-                            db.create_collection(collection_name)
-                        except CollectionInvalid:
+                        if collection_name in existing:
                             db.drop_collection(collection_name)
-                            db.create_collection(collection_name)
 
                         created_resources.append(
                             {"db": db_name, "collection": collection_name}
                         )
 
-                        # Add data if specified
-                        if "data" in collection_config:
-                            collection = db[collection_name]
-                            for record in collection_config["data"]:
-                                collection.insert_one(record)
+                        # Seeded collections are created implicitly by insert_many
+                        # (which also accepts pre-encoded RawBSONDocuments)
+                        if collection_config.get("data"):
+                            collection = db.get_collection(
+                                collection_name, write_concern=_SEED_WRITE_CONCERN
+                            )
+                            collection.insert_many(collection_config["data"])
+                        else:
+                            try:
+                                db.create_collection(collection_name)
+                            except CollectionInvalid:
+                                # Created concurrently since the listing above
+                                db.drop_collection(collection_name)
+                                db.create_collection(collection_name)
 
         creation_end = time.time()
         print(f"MongoDB resource creation took {creation_end - creation_start:.2f}s")
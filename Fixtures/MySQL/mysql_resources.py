@@ -2,7 +2,14 @@ import pytest
 import json
 import time
 import os
+import uuid
+import atexit
+import tempfile
+import threading
 import mysql.connector
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
+from itertools import groupby
 from typing import Dict, List, Any, Optional
 from typing_extensions import TypedDict
 from Fixtures.base_fixture import DEBenchFixture
@@ -22,6 +29,10 @@ class MySQLTableConfig(TypedDict):
     name: str
     columns: List[MySQLColumnConfig]
     data: Optional[List[Dict[str, Any]]]
+    data_columns: Optional[List[str]]
+    data_rows: Optional[List[tuple]]
+    # Agent-facing metadata; not used when creating the table
+    partition_hint: Optional[str]
 
 
 class MySQLDatabaseConfig(TypedDict):
@@ -49,8 +60,31 @@ class MySQLFixture(
 ):
     """MySQL fixture implementation following the DEBenchFixture interface"""
 
+    # Maximum number of connections in each session-wide pool; they are opened
+    # on demand, so a pool only grows to the peak number of concurrent borrowers
+    POOL_SIZE = 4
+
+    # Connection pools shared by every MySQLFixture in the process (session scope),
+    # keyed by server and user, so validations reuse TCP/auth sessions across tests.
+    # _session_pool_opened counts the connections each pool has opened so far
+    _session_pools: Dict[tuple, MySQLConnectionPool] = {}
+    _session_pool_opened: Dict[tuple, int] = {}
+    _session_pools_lock = threading.Lock()
+
     def get_connection(self, database: Optional[str] = None):
-        """Get a MySQL database connection. Useful for validation and testing."""
+        """
+        Get a MySQL database connection. Useful for validation and testing.
+
+        Connections are lent from a session-wide pool, so calling close() on them
+        returns them to the pool instead of tearing down the TCP/auth session. The
+        pool opens a new connection only when no idle one is available, and falls
+        back to a direct connection once all POOL_SIZE are in use.
+
+        With `database`, the connection is switched to it with COM_INIT_DB. Without
+        it, a pooled connection keeps whatever default database its previous
+        borrower selected, so callers that pass no database must schema-qualify
+        every table they query.
+        """
         connection_params = {
             "host": os.getenv("MYSQL_HOST"),
             "port": os.getenv("MYSQL_PORT"),
@@ -60,10 +94,57 @@ class MySQLFixture(
             "autocommit": True,  # Enable autocommit for consistent behavior
         }
 
+        server_key = (
+            connection_params["host"],
+            connection_params["port"],
+            connection_params["user"],
+        )
+        connection = None
+        with MySQLFixture._session_pools_lock:
+            pool = MySQLFixture._session_pools.get(server_key)
+            if pool is None:
+                # Created without connection arguments, so no connections are opened yet
+                pool = MySQLConnectionPool(
+                    pool_name=f"debench_{uuid.uuid4().hex}",
+                    pool_size=self.POOL_SIZE,
+                )
+                pool.set_config(**connection_params)
+                MySQLFixture._session_pools[server_key] = pool
+                MySQLFixture._session_pool_opened[server_key] = 0
+
+            try:
+                connection = pool.get_connection()
+            except PoolError:
+                if MySQLFixture._session_pool_opened[server_key] < self.POOL_SIZE:
+                    pool.add_connection()
+                    MySQLFixture._session_pool_opened[server_key] += 1
+                    connection = pool.get_connection()
+
+        if connection is None:
+            if database:
+                connection_params["database"] = database
+            return mysql.connector.connect(**connection_params)
+
         if database:
-            connection_params["database"] = database
+            connection.cmd_init_db(database)
+        return connection
 
-        return mysql.connector.connect(**connection_params)
+    @classmethod
+    def close_session_pools(cls) -> None:
+        """Close idle pooled connections; runs automatically at interpreter exit."""
+        with cls._session_pools_lock:
+            for server_key, pool in cls._session_pools.items():
+                # Borrow each idle connection and disconnect it instead of closing
+                # it, which would only hand it back to the pool
+                for _ in range(cls._session_pool_opened[server_key]):
+                    try:
+                        pool.get_connection().disconnect()
+                    except PoolError:
+                        break  # No idle connections left
+                    except Exception as e:
+                        print(f"Warning: Could not close pooled MySQL connection: {e}")
+            cls._session_pools.clear()
+            cls._session_pool_opened.clear()
 
     def test_setup(
         self, resource_config: Optional[MySQLResourceConfig] = None
@@ -109,6 +190,7 @@ class MySQLFixture(
             autocommit=True,  # Enable autocommit for DDL operations
             sql_mode="",  # Disable strict mode to avoid issues
             use_unicode=True,
+            allow_local_infile=True,  # Large seed batches use LOAD DATA LOCAL INFILE
         )
         cursor = connection.cursor()
 
@@ -197,27 +279,12 @@ class MySQLFixture(
                                 print(f"Created MySQL table {table_name} in {db_name}")
                                 db_resource["tables"].append(table_name)
 
-                                # Insert data if provided
-                                if "data" in table_config and table_config["data"]:
-                                    print(
-                                        f"Inserting {len(table_config['data'])} records into {table_name}..."
-                                    )
-                                    for i, record in enumerate(table_config["data"]):
-                                        columns = list(record.keys())
-                                        values = list(record.values())
-                                        placeholders = ", ".join(["%s"] * len(values))
-                                        insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
-                                        print(f"Inserting record {i+1}: {record}")
-                                        cursor.execute(insert_sql, values)
-
-                                    # Note: autocommit=True means we don't need this, but keeping for safety
-                                    print(
-                                        f"Committing {len(table_config['data'])} records..."
-                                    )
-                                    # connection.commit()  # Skip explicit commit with autocommit=True
-                                    print(
-                                        f"Inserted {len(table_config['data'])} records into {table_name}"
-                                    )
+                        # Insert data if provided, once every table exists
+                        self._seed_tables(
+                            connection,
+                            cursor,
+                            [t for t in db_config["tables"] if "columns" in t],
+                        )
 
         finally:
             print(f"Closing MySQL connection")
@@ -247,6 +314,133 @@ class MySQLFixture(
         print(f"MySQL resource {resource_id} created successfully")
         return resource_data
 
+    # Seed batches at least this large are streamed with LOAD DATA LOCAL INFILE;
+    # smaller ones are cheaper as a single multi-row INSERT than a temp file
+    LOAD_DATA_MIN_ROWS = 500
+
+    # Maximum rows per multi-row INSERT statement built by executemany()
+    INSERT_BATCH_ROWS = 1000
+
+    # Stage LOAD DATA files in memory-backed tmpfs where available, so the rows are
+    # never written to and read back from disk (None uses the default temp dir)
+    LOAD_DATA_TMP_DIR = (
+        "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+    )
+
+    # Escapes for LOAD DATA's default text format (FIELDS ESCAPED BY '\\')
+    _TSV_ESCAPES = str.maketrans(
+        {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"}
+    )
+
+    @classmethod
+    def _to_tsv_field(cls, value: Any) -> str:
+        """Encode a single value for LOAD DATA, with NULL as \\N."""
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        return str(value).translate(cls._TSV_ESCAPES)
+
+    @classmethod
+    def _load_data_infile(cls, cursor, table_name: str, columns: List[str], rows: List[tuple]) -> None:
+        """Write rows to a temporary TSV file (in tmpfs if possible) and bulk load it with LOAD DATA LOCAL INFILE."""
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            newline="",
+            prefix="debench_seed_",
+            suffix=".tsv",
+            dir=cls.LOAD_DATA_TMP_DIR,
+            delete=False,
+        ) as tsv_file:
+            tsv_file.writelines(
+                "\t".join(map(cls._to_tsv_field, row)) + "\n" for row in rows
+            )
+
+        try:
+            tsv_path = tsv_file.name.replace("\\", "\\\\").replace("'", "\\'")
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{tsv_path}' INTO TABLE {table_name} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                "LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})"
+            )
+        finally:
+            os.unlink(tsv_file.name)
+
+    @classmethod
+    def _insert_table_data(cls, cursor, table_name: str, table_config: MySQLTableConfig) -> int:
+        """
+        Bulk insert a table's seed data, returning the number of rows inserted.
+
+        Accepts either positional "data_rows" with a "data_columns" list, or the
+        "data" list of dicts. Runs of records sharing the same columns go through
+        a single executemany(), which mysql.connector rewrites into one multi-row
+        INSERT instead of a round trip per record. Large runs are streamed with
+        LOAD DATA LOCAL INFILE instead, falling back to executemany() when the
+        server has local_infile disabled.
+        """
+        if table_config.get("data_rows"):
+            batches = [(table_config["data_columns"], table_config["data_rows"])]
+        elif table_config.get("data"):
+            batches = [
+                (list(columns), [tuple(record.values()) for record in records])
+                for columns, records in groupby(
+                    table_config["data"], key=lambda record: tuple(record.keys())
+                )
+            ]
+        else:
+            return 0
+
+        inserted = 0
+        for columns, rows in batches:
+            print(f"Inserting {len(rows)} records into {table_name}...")
+            if len(rows) >= cls.LOAD_DATA_MIN_ROWS:
+                try:
+                    cls._load_data_infile(cursor, table_name, columns, rows)
+                    inserted += len(rows)
+                    continue
+                except mysql.connector.Error as e:
+                    print(f"LOAD DATA LOCAL INFILE unavailable ({e}), using INSERT")
+
+            placeholders = ", ".join(["%s"] * len(columns))
+            insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+            # Bound each multi-row INSERT so large batches (e.g. the LOAD DATA
+            # fallback) stay under max_allowed_packet
+            for start in range(0, len(rows), cls.INSERT_BATCH_ROWS):
+                cursor.executemany(insert_sql, rows[start : start + cls.INSERT_BATCH_ROWS])
+            inserted += len(rows)
+        return inserted
+
+    @classmethod
+    def _seed_tables(cls, connection, cursor, table_configs: List[MySQLTableConfig]) -> None:
+        """
+        Seed a database's tables in a single transaction.
+
+        Uniqueness and foreign key checks are switched off for the session while
+        loading (seed data is trusted), so rows can be loaded in any table order
+        and the redo log is flushed once at commit instead of once per statement.
+        """
+        if not any(t.get("data_rows") or t.get("data") for t in table_configs):
+            return
+
+        cursor.execute("SET SESSION unique_checks = 0, SESSION foreign_key_checks = 0")
+        try:
+            connection.start_transaction()
+            try:
+                for table_config in table_configs:
+                    table_name = table_config["name"]
+                    inserted = cls._insert_table_data(cursor, table_name, table_config)
+                    if inserted:
+                        print(f"Inserted {inserted} records into {table_name}")
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        finally:
+            cursor.execute("SET SESSION unique_checks = 1, SESSION foreign_key_checks = 1")
+
     def test_teardown(self, resource_data: MySQLResourceData) -> None:
         """Clean up MySQL resource"""
         resource_id = resource_data.get("resource_id", "unknown")
@@ -378,3 +572,7 @@ def mysql_resource(request):
 
     # Use the fixture class for teardown
     mysql_fixture.test_teardown(resource_data)
+
+
+# Pooled sessions outlive individual fixtures, so release them once at exit
+atexit.register(MySQLFixture.close_session_pools)
@@ -1,8 +1,7 @@
 # Braintrust-only Airflow test - no pytest dependencies
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
-import os
-import importlib
+from Tests._common import load_configs
 import time
 import uuid
 import requests
@@ -10,10 +9,7 @@ from typing import List, Dict, Any
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
 
 # Generate unique identifiers for parallel execution
 test_timestamp = int(time.time())
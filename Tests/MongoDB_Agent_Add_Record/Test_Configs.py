@@ -1,5 +1,5 @@
 import os
 
-User_Input = "Go to agent_test_collection in MongoDB and add another record. Please add the record with the name 'John Doe' and the age 30."
+User_Input = "Go to agent_test_collection in MongoDB and add another record. Please add the record with the _id 'john_doe_v1', the name 'John Doe' and the age 30."
 
 # Configuration will be generated dynamically by create_config function
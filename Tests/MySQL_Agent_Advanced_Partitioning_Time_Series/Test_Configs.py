@@ -1,15 +1,29 @@
 import os
+from functools import cache
+from typing import Optional
+
 
 # AI Agent task for MySQL advanced partitioning for time-series analytics
-User_Input = """
+@cache
+def user_input(window_months: int = 6, partition_hint: Optional[str] = None) -> str:
+    """Build the agent prompt for a given retention window and partition layout (cached per arguments)."""
+    if partition_hint is None:
+        partition_hint = "PARTITION BY RANGE COLUMNS(reading_timestamp) (...)"
+    return f"""
 
 Implement an advanced partitioning strategy for the time-series data in the `sensor_readings` table:
 
 1. Analyze the existing sensor data
 2. Implement RANGE partitioning by month while using logical partition names like p_2025_09, p_2025_10, etc.
+   Partition on the `reading_timestamp` column directly (not YEAR()/TO_DAYS() of it) so time-range filters are prunable, e.g.:
+{partition_hint}
 3. Create optimized indexes for time-series queries
-4. Create a stored procedure for automatic partition management to manage partitions for a 6 month window
+4. Create a stored procedure for automatic partition management to manage partitions for a {window_months} month window
 6. Create a summary/aggregation table for daily aggregates by sensor_id: avg_temperature, min/max humidity, pressure readings while using the same partitioning strategy
 """
 
+
+# Default prompt, kept as a module attribute for the test loaders
+User_Input = user_input()
+
 # Configuration will be generated dynamically by create_config function
@@ -2,19 +2,57 @@
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
 import os
-import importlib
+from Tests._common import build_step_result, load_configs
 import time
 import uuid
 import datetime
+import functools
 import mysql.connector
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
+
+
+def _year_month(today: datetime.datetime, months_ago: int) -> Tuple[int, int]:
+    """
+    Get the (year, month) pair for the month `months_ago` months before `today`
+
+    :param datetime.datetime today: The reference date
+    :param int months_ago: The number of months to go back
+    :return: The (year, month) tuple of the target month
+    """
+    year, month_index = divmod(today.year * 12 + today.month - 1 - months_ago, 12)
+    return year, month_index + 1
+
+
+def _month_start(today: datetime.datetime, months_ago: int, hour: Optional[int] = 0, minute: Optional[int] = 0) -> datetime.datetime:
+    """
+    Get the first day of the target month relative to `today`
+
+    :param datetime.datetime today: The reference date
+    :param int months_ago: The number of months ago to get the first day of
+    :param Optional[int] hour: The hour of the day
+    :param Optional[int] minute: The minute of the hour
+    :return: The first day of the target month
+    """
+    year, month = _year_month(today, months_ago)
+    return datetime.datetime(year, month, 1, hour, minute, 0)
+
+def _month_mid(today: datetime.datetime, months_ago: int, day: Optional[int] = 15, hour: Optional[int] = 12, minute: Optional[int] = 0) -> datetime.datetime:
+    """
+    Get the middle day of the target month relative to `today`
+
+    :param datetime.datetime today: The reference date
+    :param int months_ago: The number of months ago to get the middle day of
+    :param Optional[int] day: The day of the month
+    :param Optional[int] hour: The hour of the day
+    :param Optional[int] minute: The minute of the hour
+    :return: The middle day of the target month
+    """
+    year, month = _year_month(today, months_ago)
+    return datetime.datetime(year, month, day, hour, minute, 0)
 
 
 def get_month_start(months_ago: int, hour: Optional[int] = 0, minute: Optional[int] = 0) -> datetime.datetime:
@@ -26,14 +64,7 @@ def get_month_start(months_ago: int, hour: Optional[int] = 0, minute: Optional[i
     :param Optional[int] minute: The minute of the hour
     :return: The first day of the target month
     """
-    today = datetime.datetime.now()
-    # Calculate the first day of the target month
-    year = today.year
-    month = today.month - months_ago
-    while month <= 0:
-        month += 12
-        year -= 1
-    return datetime.datetime(year, month, 1, hour, minute, 0)
+    return _month_start(datetime.datetime.now(), months_ago, hour, minute)
 
 def get_month_mid(months_ago: int, day: Optional[int] = 15, hour: Optional[int] = 12, minute: Optional[int] = 0) -> datetime.datetime:
     """
@@ -45,13 +76,235 @@ def get_month_mid(months_ago: int, day: Optional[int] = 15, hour: Optional[int]
     :param Optional[int] minute: The minute of the hour
     :return: The middle day of the target month
     """
-    today = datetime.datetime.now()
-    year = today.year
-    month = today.month - months_ago
-    while month <= 0:
-        month += 12
-        year -= 1
-    return datetime.datetime(year, month, day, hour, minute, 0)
+    return _month_mid(datetime.datetime.now(), months_ago, day, hour, minute)
+
+
+def _partition_hint(today: datetime.datetime, months_back: int) -> str:
+    """
+    Build a RANGE COLUMNS partition clause with one partition per seeded month
+
+    Partitioning on the DATETIME column itself (rather than YEAR()/TO_DAYS() of it)
+    keeps plain `WHERE reading_timestamp ...` filters prunable.
+
+    :param datetime.datetime today: The reference date
+    :param int months_back: The number of months before the current one that hold data
+    :return: The PARTITION BY clause suggested to the agent
+    """
+    partitions = []
+    for months_ago in range(months_back, -1, -1):
+        year, month = _year_month(today, months_ago)
+        next_year, next_month = _year_month(today, months_ago - 1)
+        partitions.append(
+            f"PARTITION p_{year}_{month:02d} VALUES LESS THAN ('{next_year}-{next_month:02d}-01')"
+        )
+    partitions.append("PARTITION p_future VALUES LESS THAN (MAXVALUE)")
+    return "PARTITION BY RANGE COLUMNS(reading_timestamp) (\n    " + ",\n    ".join(partitions) + "\n)"
+
+
+# Seed readings per month: (months_ago, start-of-month (hour, minute), mid-month
+# (day, hour, minute), readings at each time as (sensor_id, temperature, humidity,
+# pressure, location))
+_SENSOR_READING_SPECS = (
+    # Current Month
+    (
+        0,
+        (8, 0),
+        (15, 14, 30),
+        (
+            (101, 22.5, 65.2, 1013.25, "Building_A_Floor_1"),
+            (102, 23.1, 62.8, 1012.80, "Building_A_Floor_2"),
+            (103, 21.8, 68.5, 1014.10, "Building_B_Floor_1"),
+        ),
+        (
+            (101, 25.2, 58.3, 1015.45, "Building_A_Floor_1"),
+            (102, 24.8, 60.1, 1014.90, "Building_A_Floor_2"),
+        ),
+    ),
+    # Previous Month
+    (
+        1,
+        (9, 0),
+        (15, 16, 45),
+        (
+            (101, 19.5, 72.1, 1016.20, "Building_A_Floor_1"),
+            (102, 20.2, 69.8, 1015.75, "Building_A_Floor_2"),
+            (103, 18.9, 75.2, 1017.30, "Building_B_Floor_1"),
+        ),
+        (
+            (104, 17.3, 78.5, 1018.10, "Building_C_Floor_1"),
+            (105, 18.1, 76.2, 1017.85, "Building_C_Floor_2"),
+        ),
+    ),
+    # Two Months Ago
+    (
+        2,
+        (10, 15),
+        (15, 12, 30),
+        (
+            (101, 15.8, 82.3, 1019.45, "Building_A_Floor_1"),
+            (102, 16.5, 80.1, 1018.90, "Building_A_Floor_2"),
+            (103, 14.9, 84.7, 1020.20, "Building_B_Floor_1"),
+        ),
+        (
+            (104, 13.2, 87.1, 1021.15, "Building_C_Floor_1"),
+            (105, 14.0, 85.8, 1020.75, "Building_C_Floor_2"),
+        ),
+    ),
+    # Three Months Ago
+    (
+        3,
+        (7, 20),
+        (15, 15, 40),
+        (
+            (101, 12.5, 89.2, 1022.30, "Building_A_Floor_1"),
+            (102, 13.1, 87.5, 1021.85, "Building_A_Floor_2"),
+            (103, 11.8, 91.3, 1023.10, "Building_B_Floor_1"),
+        ),
+        (
+            (106, 10.9, 93.1, 1024.25, "Building_D_Floor_1"),
+            (107, 11.6, 91.8, 1023.75, "Building_D_Floor_2"),
+        ),
+    ),
+    # Four Months Ago
+    (
+        4,
+        (6, 30),
+        (15, 18, 50),
+        (
+            (101, 11.5, 92.2, 1024.45, "Building_A_Floor_1"),
+            (102, 12.1, 90.5, 1023.90, "Building_A_Floor_2"),
+            (103, 10.8, 94.3, 1025.20, "Building_B_Floor_1"),
+        ),
+        (
+            (108, 9.9, 96.1, 1026.15, "Building_E_Floor_1"),
+            (109, 10.6, 94.8, 1025.75, "Building_E_Floor_2"),
+        ),
+    ),
+    # Five Months Ago
+    (
+        5,
+        (5, 45),
+        (15, 20, 25),
+        (
+            (101, 10.5, 93.3, 1025.55, "Building_A_Floor_1"),
+            (102, 11.1, 91.6, 1025.00, "Building_A_Floor_2"),
+            (103, 9.8, 95.4, 1026.30, "Building_B_Floor_1"),
+        ),
+        (
+            (110, 8.9, 97.2, 1027.25, "Building_F_Floor_1"),
+            (111, 9.6, 95.9, 1026.75, "Building_F_Floor_2"),
+        ),
+    ),
+    # Six Months Ago
+    (
+        6,
+        (4, 50),
+        (15, 22, 10),
+        (
+            (101, 9.5, 94.4, 1027.45, "Building_A_Floor_1"),
+            (102, 10.1, 92.7, 1026.90, "Building_A_Floor_2"),
+            (103, 8.8, 96.5, 1028.20, "Building_B_Floor_1"),
+        ),
+        (
+            (112, 7.9, 98.3, 1029.15, "Building_G_Floor_1"),
+            (113, 8.6, 97.0, 1028.75, "Building_G_Floor_2"),
+        ),
+    ),
+    # Seven Months Ago
+    (
+        7,
+        (3, 55),
+        (15, 23, 40),
+        (
+            (101, 8.5, 95.5, 1029.45, "Building_A_Floor_1"),
+            (102, 9.1, 93.8, 1028.90, "Building_A_Floor_2"),
+            (103, 7.8, 97.6, 1030.20, "Building_B_Floor_1"),
+        ),
+        (
+            (114, 6.9, 99.4, 1031.15, "Building_H_Floor_1"),
+            (115, 7.6, 98.1, 1030.75, "Building_H_Floor_2"),
+        ),
+    ),
+    # Eight Months Ago
+    (
+        8,
+        (3, 0),
+        (15, 23, 59),
+        (
+            (101, 7.5, 96.5, 1031.45, "Building_A_Floor_1"),
+            (102, 8.1, 94.8, 1030.90, "Building_A_Floor_2"),
+            (103, 6.8, 98.6, 1032.20, "Building_B_Floor_1"),
+        ),
+        (
+            (116, 5.9, 100.4, 1033.15, "Building_I_Floor_1"),
+            (117, 6.6, 99.1, 1032.75, "Building_I_Floor_2"),
+        ),
+    ),
+)
+
+
+# Optional stress variant: when set, seed this many generated readings instead of
+# the hand-written spec above
+STRESS_ROWS = int(os.getenv("PARTITIONING_STRESS_ROWS", "0"))
+
+
+# Location names for the stress variant's sensors 101-117, indexed by sensor_id - 101
+_STRESS_LOCATIONS = tuple(f"Sensor_{sensor_id}_Location" for sensor_id in range(101, 118))
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_stress_readings(year: int, month: int, row_count: int) -> Tuple[tuple, ...]:
+    """
+    Generate `row_count` synthetic readings spread over the same nine months as the spec
+
+    Numeric columns are built as NumPy arrays (one per field) and only zipped into
+    row tuples at the end, so large variants are generated at C speed. The output is fully
+    determined by the current month and row count, so it is generated once per
+    process and reused by every later fixture built in the same month.
+
+    :param int year: The year of the current month
+    :param int month: The current month
+    :param int row_count: The number of readings to generate
+    :return: Rows in data_columns order (sensor_id, reading_timestamp, temperature, humidity, pressure, location)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    months_back = len(_SENSOR_READING_SPECS)
+
+    # Random instant within a random month among the current and previous eight months
+    months_ago = rng.integers(0, months_back, row_count)
+    month_starts = np.datetime64(f"{year:04d}-{month:02d}", "M") - months_ago
+    # Real month lengths: a one-month timedelta converts at the average month length,
+    # which would push readings in short months into the next month's partition
+    month_seconds = (
+        (month_starts + 1).astype("datetime64[s]") - month_starts.astype("datetime64[s]")
+    ).astype(np.int64)
+    offsets = (rng.random(row_count) * month_seconds).astype(np.int64)
+    reading_timestamps = np.char.replace(
+        np.datetime_as_string(month_starts.astype("datetime64[s]") + offsets, unit="s"), "T", " "
+    )
+
+    # Same seasonal trend as the spec: colder and more humid further back
+    sensor_ids = rng.integers(101, 118, row_count)
+    temperature = np.round(np.linspace(22.5, 7.5, months_back)[months_ago] + rng.normal(0, 0.5, row_count), 2)
+    humidity = np.round(np.linspace(65.0, 96.5, months_back)[months_ago] + rng.normal(0, 1.0, row_count), 2)
+    pressure = np.round(np.linspace(1013.0, 1031.5, months_back)[months_ago] + rng.normal(0, 0.5, row_count), 2)
+
+    # Every row references one of the shared location strings instead of getting
+    # its own copy, so the text is allocated once per sensor rather than per row
+    locations = map(_STRESS_LOCATIONS.__getitem__, (sensor_ids - 101).tolist())
+
+    return tuple(
+        zip(
+            sensor_ids.tolist(),
+            reading_timestamps.tolist(),
+            temperature.tolist(),
+            humidity.tolist(),
+            pressure.tolist(),
+            locations,
+        )
+    )
 
 
 def get_fixtures() -> List[DEBenchFixture]:
@@ -64,6 +317,41 @@ def get_fixtures() -> List[DEBenchFixture]:
     test_timestamp = int(time.time())
     test_uuid = uuid.uuid4().hex[:8]
 
+    # Read the clock once so every generated row agrees on "today", even when
+    # the fixture is built across a month boundary
+    now_dt = datetime.datetime.now()
+
+    # Several rows share a timestamp, so format each distinct one only once
+    @functools.lru_cache(maxsize=None)
+    def _fmt_start(months_ago: int, hour: int, minute: int) -> str:
+        return _month_start(now_dt, months_ago, hour, minute).strftime("%Y-%m-%d %H:%M:%S")
+
+    @functools.lru_cache(maxsize=None)
+    def _fmt_mid(months_ago: int, day: int, hour: int, minute: int) -> str:
+        return _month_mid(now_dt, months_ago, day, hour, minute).strftime("%Y-%m-%d %H:%M:%S")
+
+    # Generate readings for the current month and previous months relative to
+    # today to simulate time-series data for partitioning
+    if STRESS_ROWS:
+        sensor_readings = _generate_stress_readings(now_dt.year, now_dt.month, STRESS_ROWS)
+    else:
+        sensor_readings = []
+        for (
+            months_ago,
+            (start_hour, start_minute),
+            (mid_day, mid_hour, mid_minute),
+            start_readings,
+            mid_readings,
+        ) in _SENSOR_READING_SPECS:
+            for reading_timestamp, readings in (
+                (_fmt_start(months_ago, start_hour, start_minute), start_readings),
+                (_fmt_mid(months_ago, mid_day, mid_hour, mid_minute), mid_readings),
+            ):
+                for sensor_id, temperature, humidity, pressure, location in readings:
+                    sensor_readings.append(
+                        (sensor_id, reading_timestamp, temperature, humidity, pressure, location)
+                    )
+
     # Initialize MySQL fixture with comprehensive time-series sensor data
     custom_mysql_config = {
         "resource_id": f"mysql_partitioning_test_{test_timestamp}_{test_uuid}",
@@ -87,73 +375,18 @@ def get_fixtures() -> List[DEBenchFixture]:
                             {"name": "location", "type": "VARCHAR(100)"},
                         ],
                         # Time-series sensor data spanning multiple months for partitioning demo
-                        "data": [
-                            # Dynamically generate reading_timestamps based on current date
-                            # This block generates timestamps for current month and previous months
-                            # to simulate time-series data for partitioning
-                            # Current Month Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(0, 8, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 22.5, "humidity": 65.2, "pressure": 1013.25, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(0, 8, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 23.1, "humidity": 62.8, "pressure": 1012.80, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(0, 8, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 21.8, "humidity": 68.5, "pressure": 1014.10, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 101, "reading_timestamp": get_month_mid(0, 15, 14, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 25.2, "humidity": 58.3, "pressure": 1015.45, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_mid(0, 15, 14, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 24.8, "humidity": 60.1, "pressure": 1014.90, "location": "Building_A_Floor_2"},
-
-                            # Previous Month Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(1, 9, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 19.5, "humidity": 72.1, "pressure": 1016.20, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(1, 9, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 20.2, "humidity": 69.8, "pressure": 1015.75, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(1, 9, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 18.9, "humidity": 75.2, "pressure": 1017.30, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 104, "reading_timestamp": get_month_mid(1, 15, 16, 45).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 17.3, "humidity": 78.5, "pressure": 1018.10, "location": "Building_C_Floor_1"},
-                            {"sensor_id": 105, "reading_timestamp": get_month_mid(1, 15, 16, 45).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 18.1, "humidity": 76.2, "pressure": 1017.85, "location": "Building_C_Floor_2"},
-
-                            # Two Months Ago Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(2, 10, 15).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 15.8, "humidity": 82.3, "pressure": 1019.45, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(2, 10, 15).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 16.5, "humidity": 80.1, "pressure": 1018.90, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(2, 10, 15).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 14.9, "humidity": 84.7, "pressure": 1020.20, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 104, "reading_timestamp": get_month_mid(2, 15, 12, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 13.2, "humidity": 87.1, "pressure": 1021.15, "location": "Building_C_Floor_1"},
-                            {"sensor_id": 105, "reading_timestamp": get_month_mid(2, 15, 12, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 14.0, "humidity": 85.8, "pressure": 1020.75, "location": "Building_C_Floor_2"},
-
-                            # Three Months Ago Data  
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(3, 7, 20).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 12.5, "humidity": 89.2, "pressure": 1022.30, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(3, 7, 20).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 13.1, "humidity": 87.5, "pressure": 1021.85, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(3, 7, 20).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 11.8, "humidity": 91.3, "pressure": 1023.10, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 106, "reading_timestamp": get_month_mid(3, 15, 15, 40).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 10.9, "humidity": 93.1, "pressure": 1024.25, "location": "Building_D_Floor_1"},
-                            {"sensor_id": 107, "reading_timestamp": get_month_mid(3, 15, 15, 40).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 11.6, "humidity": 91.8, "pressure": 1023.75, "location": "Building_D_Floor_2"},
-
-                            # Four Months Ago Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(4, 6, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 11.5, "humidity": 92.2, "pressure": 1024.45, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(4, 6, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 12.1, "humidity": 90.5, "pressure": 1023.90, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(4, 6, 30).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 10.8, "humidity": 94.3, "pressure": 1025.20, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 108, "reading_timestamp": get_month_mid(4, 15, 18, 50).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 9.9, "humidity": 96.1, "pressure": 1026.15, "location": "Building_E_Floor_1"},
-                            {"sensor_id": 109, "reading_timestamp": get_month_mid(4, 15, 18, 50).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 10.6, "humidity": 94.8, "pressure": 1025.75, "location": "Building_E_Floor_2"},
-
-                            # Five Months Ago Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(5, 5, 45).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 10.5, "humidity": 93.3, "pressure": 1025.55, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(5, 5, 45).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 11.1, "humidity": 91.6, "pressure": 1025.00, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(5, 5, 45).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 9.8, "humidity": 95.4, "pressure": 1026.30, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 110, "reading_timestamp": get_month_mid(5, 15, 20, 25).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 8.9, "humidity": 97.2, "pressure": 1027.25, "location": "Building_F_Floor_1"},
-                            {"sensor_id": 111, "reading_timestamp": get_month_mid(5, 15, 20, 25).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 9.6, "humidity": 95.9, "pressure": 1026.75, "location": "Building_F_Floor_2"},
-
-                            # Six Months Ago Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(6, 4, 50).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 9.5, "humidity": 94.4, "pressure": 1027.45, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(6, 4, 50).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 10.1, "humidity": 92.7, "pressure": 1026.90, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(6, 4, 50).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 8.8, "humidity": 96.5, "pressure": 1028.20, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 112, "reading_timestamp": get_month_mid(6, 15, 22, 10).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 7.9, "humidity": 98.3, "pressure": 1029.15, "location": "Building_G_Floor_1"},
-                            {"sensor_id": 113, "reading_timestamp": get_month_mid(6, 15, 22, 10).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 8.6, "humidity": 97.0, "pressure": 1028.75, "location": "Building_G_Floor_2"},
-
-                            # Seven Months Ago Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(7, 3, 55).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 8.5, "humidity": 95.5, "pressure": 1029.45, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(7, 3, 55).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 9.1, "humidity": 93.8, "pressure": 1028.90, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(7, 3, 55).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 7.8, "humidity": 97.6, "pressure": 1030.20, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 114, "reading_timestamp": get_month_mid(7, 15, 23, 40).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 6.9, "humidity": 99.4, "pressure": 1031.15, "location": "Building_H_Floor_1"},
-                            {"sensor_id": 115, "reading_timestamp": get_month_mid(7, 15, 23, 40).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 7.6, "humidity": 98.1, "pressure": 1030.75, "location": "Building_H_Floor_2"},
-
-                            # Eight Months Ago Data
-                            {"sensor_id": 101, "reading_timestamp": get_month_start(8, 3, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 7.5, "humidity": 96.5, "pressure": 1031.45, "location": "Building_A_Floor_1"},
-                            {"sensor_id": 102, "reading_timestamp": get_month_start(8, 3, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 8.1, "humidity": 94.8, "pressure": 1030.90, "location": "Building_A_Floor_2"},
-                            {"sensor_id": 103, "reading_timestamp": get_month_start(8, 3, 0).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 6.8, "humidity": 98.6, "pressure": 1032.20, "location": "Building_B_Floor_1"},
-                            {"sensor_id": 116, "reading_timestamp": get_month_mid(8, 15, 23, 59).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 5.9, "humidity": 100.4, "pressure": 1033.15, "location": "Building_I_Floor_1"},
-                            {"sensor_id": 117, "reading_timestamp": get_month_mid(8, 15, 23, 59).strftime("%Y-%m-%d %H:%M:%S"), "temperature": 6.6, "humidity": 99.1, "pressure": 1032.75, "location": "Building_I_Floor_2"},
+                        "data_columns": [
+                            "sensor_id",
+                            "reading_timestamp",
+                            "temperature",
+                            "humidity",
+                            "pressure",
+                            "location",
                         ],
+                        "data_rows": sensor_readings,
+                        # Suggested to the agent in the prompt; built from the same "today"
+                        # as the readings so the partition bounds line up with the data
+                        "partition_hint": _partition_hint(now_dt, len(_SENSOR_READING_SPECS) - 1),
                     }
                 ],
             }
@@ -173,14 +406,105 @@ def create_model_inputs(
     """
     from extract_test_configs import create_config_from_fixtures
 
+    # Pick up the partition hint generated alongside the seed data
+    partition_hint = next(
+        (
+            table["partition_hint"]
+            for fixture in fixtures
+            if fixture.get_resource_type() == "mysql_resource"
+            for database in fixture.custom_config["databases"]
+            for table in database["tables"]
+            if table.get("partition_hint")
+        ),
+        None,
+    )
+
     # Use the helper to automatically create config from all fixtures
     return {
         **base_model_inputs,
         "model_configs": create_config_from_fixtures(fixtures),
-        "task_description": Test_Configs.User_Input,
+        "task_description": Test_Configs.user_input(partition_hint=partition_hint),
     }
 
 
+# Partition and schema metadata for validate_test, fetched in a single round trip.
+# Rows are (kind, partition_name, value, partition_ordinal_position,
+# partition_expression); value is table_rows for partitions and the count itself
+# for the other kinds. Sorting on the ordinal puts the count rows (NULL ordinal)
+# first, then partitions in order.
+_VALIDATION_METADATA_SQL = """
+    SELECT 'partition', partition_name, table_rows, partition_ordinal_position, partition_expression
+    FROM information_schema.partitions
+    WHERE table_schema = %s
+    AND table_name = 'sensor_readings'
+    AND partition_name IS NOT NULL
+    UNION ALL
+    SELECT 'procedures', NULL, COUNT(*), NULL, NULL
+    FROM information_schema.routines
+    WHERE routine_schema = %s
+    AND routine_type = 'PROCEDURE'
+    UNION ALL
+    SELECT 'additional_tables', NULL, COUNT(*), NULL, NULL
+    FROM information_schema.tables
+    WHERE table_schema = %s
+    AND table_name != 'sensor_readings'
+    UNION ALL
+    SELECT 'table_exists', NULL, COUNT(*), NULL, NULL
+    FROM information_schema.tables
+    WHERE table_schema = %s
+    AND table_name = 'sensor_readings'
+    UNION ALL
+    SELECT 'index_columns', NULL, COUNT(*), NULL, NULL
+    FROM information_schema.statistics
+    WHERE table_schema = %s
+    AND table_name = 'sensor_readings'
+    AND index_name != 'PRIMARY'
+    ORDER BY 4
+"""
+
+# InnoDB's table_rows is an estimate; below this many rows it is not trusted
+# for the row-count threshold and the exact (bounded) count is used instead
+_EXACT_COUNT_BELOW_ESTIMATE = 30
+
+# Counts at most _EXACT_COUNT_BELOW_ESTIMATE rows, so it is cheap however large
+# the table is and exact whenever the table is below the threshold
+_BOUNDED_COUNT_SQL = f"""
+    SELECT COUNT(*) FROM (
+        SELECT 1 FROM sensor_readings LIMIT {_EXACT_COUNT_BELOW_ESTIMATE}
+    ) AS bounded
+"""
+
+
+# Static (name, description, in-progress message) for each validation step
+_STEP_META = (
+    (
+        "Agent Task Execution",
+        "AI Agent executes partitioning implementation",
+        "Checking if AI agent executed the partitioning task...",
+    ),
+    (
+        "Partitioned Table Creation",
+        "Verify sensor_readings table with partitioning",
+        "Validating partitioned table structure...",
+    ),
+    (
+        "Partition Structure Validation",
+        "Verify multiple partitions exist and are properly configured",
+        "Validating partition configuration...",
+    ),
+    (
+        "Data Distribution Validation",
+        "Verify data is properly distributed across partitions",
+        "Validating data distribution across partitions...",
+    ),
+    (
+        "Performance Optimizations",
+        "Verify indexes and stored procedures for partition management",
+        "Validating performance optimizations...",
+    ),
+)
+
+
 def validate_test(model_result, fixtures=None):
     """
     Validates that the AI agent successfully implemented advanced partitioning for time-series data.
@@ -200,53 +524,18 @@ def validate_test(model_result, fixtures=None):
     Returns:
         dict: Contains 'score' float and 'metadata' dict with validation details
     """
-    # Create test steps for this validation
-    test_steps = [
-        {
-            "name": "Agent Task Execution",
-            "description": "AI Agent executes partitioning implementation",
-            "status": "running",
-            "Result_Message": "Checking if AI agent executed the partitioning task...",
-        },
-        {
-            "name": "Partitioned Table Creation",
-            "description": "Verify sensor_readings table with partitioning",
-            "status": "running",
-            "Result_Message": "Validating partitioned table structure...",
-        },
-        {
-            "name": "Partition Structure Validation",
-            "description": "Verify multiple partitions exist and are properly configured",
-            "status": "running",
-            "Result_Message": "Validating partition configuration...",
-        },
-        {
-            "name": "Data Distribution Validation",
-            "description": "Verify data is properly distributed across partitions",
-            "status": "running",
-            "Result_Message": "Validating data distribution across partitions...",
-        },
-        {
-            "name": "Performance Optimizations",
-            "description": "Verify indexes and stored procedures for partition management",
-            "status": "running",
-            "Result_Message": "Validating performance optimizations...",
-        },
-    ]
+    # Bit i is set once step i passes; step dicts are only built in build_step_result
+    passed_mask = 0
+    messages: List[Optional[str]] = [None] * len(_STEP_META)
 
     try:
         # Step 1: Check that the agent task executed
         if not model_result or model_result.get("status") == "failed":
-            test_steps[0]["status"] = "failed"
-            test_steps[0][
-                "Result_Message"
-            ] = "❌ AI Agent task execution failed or returned no result"
-            return {"score": 0.0, "metadata": {"test_steps": test_steps}}
+            messages[0] = "❌ AI Agent task execution failed or returned no result"
+            return build_step_result(_STEP_META, passed_mask, messages)
 
-        test_steps[0]["status"] = "passed"
-        test_steps[0][
-            "Result_Message"
-        ] = "✅ AI Agent completed task execution successfully"
+        passed_mask |= 1 << 0
+        messages[0] = "✅ AI Agent completed task execution successfully"
 
         # Get MySQL fixture for validation
         mysql_fixture = None
@@ -265,143 +554,119 @@ def validate_test(model_result, fixtures=None):
 
         db_name = resource_data["created_resources"][0]["name"]
         db_connection = mysql_fixture.get_connection(database=db_name)
+        # Unbuffered, so the metadata rows are streamed rather than held client-side
         db_cursor = db_connection.cursor()
 
         try:
             # Step 2: Validate partitioned table exists
-            db_cursor.execute("SHOW TABLES LIKE 'sensor_readings'")
-            table_exists = db_cursor.fetchone()
-
-            if not table_exists:
-                test_steps[1]["status"] = "failed"
-                test_steps[1]["Result_Message"] = "❌ sensor_readings table not found"
-                return {"score": 0.2, "metadata": {"test_steps": test_steps}}
-
-            # Check if table is partitioned
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.partitions 
-                WHERE table_schema = %s 
-                AND table_name = 'sensor_readings' 
-                AND partition_name IS NOT NULL
-            """, (db_name,))
-            
-            partition_count = db_cursor.fetchone()[0]
+            # Existence, partitions, indexes and procedure/table counts in one round trip
+            db_cursor.execute(_VALIDATION_METADATA_SQL, (db_name,) * 5)
+
+            # Stream the rows and keep only running aggregates, so memory stays
+            # constant however many partitions the agent created
+            partition_count = 0
+            partition_names = []
+            partition_rows_estimate = 0
+            partitions_with_data = 0
+            partition_expression = None
+            metadata_counts = {}
+            for kind, partition_name, value, ordinal_position, expression in db_cursor:
+                if kind == "partition":
+                    partition_count += 1
+                    partition_expression = expression
+                    if len(partition_names) < 3:
+                        partition_names.append(partition_name)
+                    partition_rows_estimate += value or 0
+                    if value:
+                        partitions_with_data += 1
+                else:
+                    metadata_counts[kind] = value
+
+            if not metadata_counts["table_exists"]:
+                messages[1] = "❌ sensor_readings table not found"
+                return build_step_result(_STEP_META, passed_mask, messages)
 
             if partition_count > 0:
-                test_steps[1]["status"] = "passed"
-                test_steps[1]["Result_Message"] = f"✅ Partitioned sensor_readings table found with {partition_count} partitions"
+                passed_mask |= 1 << 1
+                messages[1] = f"✅ Partitioned sensor_readings table found with {partition_count} partitions"
             else:
-                test_steps[1]["status"] = "failed"
-                test_steps[1]["Result_Message"] = "❌ sensor_readings table exists but is not partitioned"
-                return {"score": 0.2, "metadata": {"test_steps": test_steps}}
+                messages[1] = "❌ sensor_readings table exists but is not partitioned"
+                return build_step_result(_STEP_META, passed_mask, messages)
 
             # Step 3: Validate partition structure
-            db_cursor.execute("""
-                SELECT partition_name, partition_expression, partition_description
-                FROM information_schema.partitions 
-                WHERE table_schema = %s 
-                AND table_name = 'sensor_readings'
-                AND partition_name IS NOT NULL
-                ORDER BY partition_ordinal_position
-            """, (db_name,))
-            
-            partitions = db_cursor.fetchall()
-
-            if len(partitions) >= 3:  # At least 3-4 months of partitions
-                test_steps[2]["status"] = "passed"
-                partition_names = [p[0] for p in partitions]
-                test_steps[2]["Result_Message"] = (
-                    f"✅ Partition structure validated: {len(partitions)} partitions "
-                    f"({', '.join(partition_names[:3])}{'...' if len(partitions) > 3 else ''})"
+            # Only partitioning on the bare column keeps `WHERE reading_timestamp ...`
+            # filters prunable; YEAR()/TO_DAYS() wrappers do not. RANGE COLUMNS lists
+            # its columns comma-separated, and only the leading one has to be the timestamp
+            partition_column = (partition_expression or "").split(",")[0].replace("`", "").strip().lower()
+            if partition_column != "reading_timestamp":
+                messages[2] = (
+                    f"❌ Partitioned on '{partition_expression}', expected RANGE COLUMNS(reading_timestamp) "
+                    "so time-range queries can be pruned"
+                )
+            elif partition_count >= 3:  # At least 3-4 months of partitions
+                passed_mask |= 1 << 2
+                messages[2] = (
+                    f"✅ Partition structure validated: {partition_count} partitions "
+                    f"({', '.join(partition_names)}{'...' if partition_count > 3 else ''})"
                 )
             else:
-                test_steps[2]["status"] = "failed"
-                test_steps[2]["Result_Message"] = f"❌ Insufficient partitions: only {len(partitions)} found, expected at least 3"
+                messages[2] = f"❌ Insufficient partitions: only {partition_count} found, expected at least 3"
 
             # Step 4: Validate data distribution
-            db_cursor.execute("SELECT COUNT(*) FROM sensor_readings")
+            # Below the threshold the bounded count is exact; above it, sum the
+            # per-partition row estimates rather than scanning every partition
+            db_cursor.execute(_BOUNDED_COUNT_SQL)
             total_records = db_cursor.fetchone()[0]
+            if total_records >= _EXACT_COUNT_BELOW_ESTIMATE:
+                total_records = max(partition_rows_estimate, total_records)
 
             if total_records >= 20:  # At least the initial sensor data (20 records)
                 # Check data distribution across partitions
-                db_cursor.execute("""
-                    SELECT 
-                        p.partition_name,
-                        p.table_rows
-                    FROM information_schema.partitions p
-                    WHERE p.table_schema = %s 
-                    AND p.table_name = 'sensor_readings'
-                    AND p.partition_name IS NOT NULL
-                    AND p.table_rows > 0
-                    ORDER BY p.partition_ordinal_position
-                """, (db_name,))
-                
-                partitions_with_data = db_cursor.fetchall()
-
-                if len(partitions_with_data) >= 2:  # Data in multiple partitions
-                    test_steps[3]["status"] = "passed"
-                    test_steps[3]["Result_Message"] = (
+                if partitions_with_data >= 2:  # Data in multiple partitions
+                    passed_mask |= 1 << 3
+                    messages[3] = (
                         f"✅ Data distributed across partitions: {total_records} total records "
-                        f"in {len(partitions_with_data)} partitions"
+                        f"in {partitions_with_data} partitions"
                     )
                 else:
-                    test_steps[3]["status"] = "failed"
-                    test_steps[3]["Result_Message"] = (
+                    messages[3] = (
                         f"❌ Data not properly distributed: {total_records} records "
-                        f"in only {len(partitions_with_data)} partitions"
+                        f"in only {partitions_with_data} partitions"
                     )
             else:
-                test_steps[3]["status"] = "failed"
-                test_steps[3]["Result_Message"] = f"❌ Insufficient sample data: only {total_records} records"
+                messages[3] = f"❌ Insufficient sample data: only {total_records} records"
 
             # Step 5: Check for performance optimizations
             optimizations_found = 0
             optimization_details = []
 
-            # Check for indexes
-            db_cursor.execute("SHOW INDEX FROM sensor_readings")
-            indexes = db_cursor.fetchall()
-            index_names = [idx[2] for idx in indexes if idx[2] != 'PRIMARY']
-            
-            if index_names:
+            # Check for indexes (one statistics row per indexed column, as SHOW INDEX)
+            index_columns = metadata_counts["index_columns"]
+            if index_columns > 0:
                 optimizations_found += 1
-                optimization_details.append(f"{len(index_names)} indexes")
+                optimization_details.append(f"{index_columns} indexes")
 
             # Check for stored procedures (partition management)
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.routines 
-                WHERE routine_schema = %s 
-                AND routine_type = 'PROCEDURE'
-            """, (db_name,))
-            
-            procedure_count = db_cursor.fetchone()[0]
+            procedure_count = metadata_counts["procedures"]
             if procedure_count > 0:
                 optimizations_found += 1
                 optimization_details.append(f"{procedure_count} stored procedures")
 
             # Check for additional tables (summary/aggregation tables)
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.tables 
-                WHERE table_schema = %s 
-                AND table_name != 'sensor_readings'
-            """, (db_name,))
-            
-            additional_tables = db_cursor.fetchone()[0]
+            additional_tables = metadata_counts["additional_tables"]
             if additional_tables > 0:
                 optimizations_found += 1
                 optimization_details.append(f"{additional_tables} additional tables")
 
             if optimizations_found >= 2:
-                test_steps[4]["status"] = "passed"
-                test_steps[4]["Result_Message"] = (
+                passed_mask |= 1 << 4
+                messages[4] = (
                     f"✅ Performance optimizations implemented: {', '.join(optimization_details)}"
                 )
             else:
-                test_steps[4]["status"] = "failed" if optimizations_found == 0 else "passed"
-                test_steps[4]["Result_Message"] = (
+                if optimizations_found > 0:
+                    passed_mask |= 1 << 4
+                messages[4] = (
                     f"{'❌' if optimizations_found == 0 else '✅'} Limited optimizations: {', '.join(optimization_details) if optimization_details else 'none found'}"
                 )
 
@@ -410,15 +675,7 @@ def validate_test(model_result, fixtures=None):
             db_connection.close()
 
     except Exception as e:
-        # Mark any unfinished steps as failed
-        for step in test_steps:
-            if step["status"] == "running":
-                step["status"] = "failed"
-                step["Result_Message"] = f"❌ Validation error: {str(e)}"
-
-    # Calculate score as the fraction of steps that passed
-    score = sum([step["status"] == "passed" for step in test_steps]) / len(test_steps)
-    return {
-        "score": score,
-        "metadata": {"test_steps": test_steps},
-    }
+        # Any unfinished steps are marked failed with the error
+        return build_step_result(_STEP_META, passed_mask, messages, error=e)
+
+    return build_step_result(_STEP_META, passed_mask, messages)
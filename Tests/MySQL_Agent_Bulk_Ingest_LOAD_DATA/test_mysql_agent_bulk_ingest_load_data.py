@@ -1,8 +1,7 @@
 # Braintrust-only MySQL test - no pytest dependencies
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
-import os
-import importlib
+from Tests._common import load_configs
 import time
 import uuid
 import mysql.connector
@@ -10,10 +9,7 @@ from typing import List, Dict, Any
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
 
 
 def get_fixtures() -> List[DEBenchFixture]:
@@ -52,28 +48,11 @@ def get_fixtures() -> List[DEBenchFixture]:
                             },
                         ],
                         # Initial product data - agent will add more via LOAD DATA INFILE
-                        "data": [
-                            {
-                                "product_id": 1,
-                                "name": "Basic Widget",
-                                "description": "A simple widget for basic needs",
-                                "price": 19.99,
-                                "category": "Widgets",
-                            },
-                            {
-                                "product_id": 2,
-                                "name": "Premium Gadget",
-                                "description": "High-quality gadget with advanced features",
-                                "price": 99.99,
-                                "category": "Gadgets",
-                            },
-                            {
-                                "product_id": 3,
-                                "name": "Standard Tool",
-                                "description": "Reliable tool for everyday use",
-                                "price": 45.50,
-                                "category": "Tools",
-                            },
+                        "data_columns": ["product_id", "name", "description", "price", "category"],
+                        "data_rows": [
+                            (1, "Basic Widget", "A simple widget for basic needs", 19.99, "Widgets"),
+                            (2, "Premium Gadget", "High-quality gadget with advanced features", 99.99, "Gadgets"),
+                            (3, "Standard Tool", "Reliable tool for everyday use", 45.50, "Tools"),
                         ],
                     }
                 ],
@@ -102,6 +81,25 @@ def create_model_inputs(
     }
 
 
+# Step 3 edge-case lookup: records with special characters, quotes, or NULL values.
+# The INSTR positions are OR'd so one non-zero result flags any of the three
+# characters, and a name whose ASCII conversion differs from the original bytes
+# contains non-ASCII (e.g. accented) characters; neither needs a per-row REGEXP
+# evaluation. The OR'd terms short-circuit left to right, so they are ordered
+# cheapest first and the charset conversion only runs for rows nothing else
+# matched. Only the number of matches is reported, so no columns (and no TEXT
+# descriptions) are sent back
+_EDGE_CASE_SQL = """
+    SELECT 1 
+    FROM products 
+    WHERE price IS NULL
+       OR (INSTR(description, ',') | INSTR(description, '"') | INSTR(description, CHAR(39))) > 0
+       OR CAST(CONVERT(name USING ascii) AS BINARY) <> CAST(name AS BINARY)
+    ORDER BY product_id
+    LIMIT 5
+"""
+
+
 def validate_test(model_result, fixtures=None):
     """
     Validates that the AI agent successfully performed bulk data ingestion with LOAD DATA INFILE.
@@ -182,39 +180,43 @@ def validate_test(model_result, fixtures=None):
         db_cursor = db_connection.cursor()
 
         try:
-            # Step 2: Verify data was imported (should be more than initial 3 records)
-            db_cursor.execute("SELECT COUNT(*) FROM products")
-            record_count = db_cursor.fetchone()[0]
-
-            if record_count > 3:  # Initial data had 3 records
-                test_steps[1]["status"] = "passed"
-                test_steps[1]["Result_Message"] = (
-                    f"✅ Data successfully imported: {record_count} total records (started with 3)"
-                )
-            else:
+            # Step 2: Verify data was imported (rows beyond the initial product_ids 1-3).
+            # A primary-key probe answers this without counting the whole table
+            db_cursor.execute("SELECT 1 FROM products WHERE product_id NOT IN (1, 2, 3) LIMIT 1")
+            if db_cursor.fetchone() is None:
+                # At most the seed rows are left, so counting them is cheap
+                db_cursor.execute("SELECT COUNT(*) FROM products")
+                record_count = db_cursor.fetchone()[0]
                 test_steps[1]["status"] = "failed"
                 test_steps[1]["Result_Message"] = f"❌ No additional data imported: only {record_count} records found (expected > 3)"
                 return {"score": 0.25, "metadata": {"test_steps": test_steps}}
 
-            # Step 3: Check for edge cases handling
-            # Look for records with special characters, quotes, or NULL values
+            # The Step 4 integrity aggregates also give the exact row count reported here.
+            # product_id is the primary key, so every row is a unique product and no
+            # COUNT(DISTINCT) sort/hash pass is needed
             db_cursor.execute("""
-                SELECT name, description, price 
-                FROM products 
-                WHERE description LIKE '%,%' 
-                   OR description LIKE '%"%' 
-                   OR description LIKE '%''%'
-                   OR name REGEXP '[àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]'
-                   OR price IS NULL
-                ORDER BY product_id
-                LIMIT 5
+                SELECT 
+                    COUNT(*) as total_records,
+                    SUM(price > 0) as valid_prices,
+                    SUM(name IS NOT NULL AND name != '') as valid_names
+                FROM products
             """)
-            edge_case_records = db_cursor.fetchall()
+            total_records, valid_prices, valid_names = db_cursor.fetchone()
+            unique_products = total_records
+
+            test_steps[1]["status"] = "passed"
+            test_steps[1]["Result_Message"] = (
+                f"✅ Data successfully imported: {total_records} total records (started with 3)"
+            )
+
+            # Step 3: Check for edge cases handling
+            db_cursor.execute(_EDGE_CASE_SQL)
+            edge_case_count = len(db_cursor.fetchall())
 
-            if edge_case_records and len(edge_case_records) > 0:
+            if edge_case_count > 0:
                 test_steps[2]["status"] = "passed"
                 test_steps[2]["Result_Message"] = (
-                    f"✅ Edge cases handled correctly: found {len(edge_case_records)} records with special characters/cases"
+                    f"✅ Edge cases handled correctly: found {edge_case_count} records with special characters/cases"
                 )
             else:
                 test_steps[2]["status"] = "failed"
@@ -222,18 +224,6 @@ def validate_test(model_result, fixtures=None):
 
             # Step 4: Data integrity checks
             # Check that data types are correct and no obvious corruption
-            db_cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_records,
-                    COUNT(DISTINCT product_id) as unique_products,
-                    SUM(CASE WHEN price > 0 THEN 1 ELSE 0 END) as valid_prices,
-                    SUM(CASE WHEN name IS NOT NULL AND name != '' THEN 1 ELSE 0 END) as valid_names
-                FROM products
-            """)
-            integrity_check = db_cursor.fetchone()
-            
-            total_records, unique_products, valid_prices, valid_names = integrity_check
-
             if total_records > 0 and valid_names > 0:
                 test_steps[3]["status"] = "passed"
                 test_steps[3]["Result_Message"] = (
@@ -250,6 +240,7 @@ def validate_test(model_result, fixtures=None):
 
         finally:
             db_cursor.close()
+            # Hands the connection back to the fixture's session pool
             db_connection.close()
 
     except Exception as e:
@@ -1,19 +1,27 @@
 # Braintrust-only MySQL test - no pytest dependencies
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
-import os
-import importlib
+from Tests._common import build_step_result, load_configs
 import time
 import uuid
-import mysql.connector
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
+
+
+# Initial customers (customer_id through subscription_plan); every one starts as a
+# single current version with the same effective dates
+_INITIAL_CUSTOMERS = (
+    (1001, "John", "Doe", "john.doe@email.com", "555-0101", "123 Main St", "New York", "NY", "BASIC"),
+    (1002, "Jane", "Smith", "jane.smith@email.com", "555-0102", "456 Oak Ave", "Los Angeles", "CA", "PREMIUM"),
+    (1003, "Bob", "Johnson", "bob.johnson@email.com", "555-0103", "789 Pine Rd", "Chicago", "IL", "ENTERPRISE"),
+    (1004, "Alice", "Williams", "alice.williams@email.com", "555-0104", "321 Elm St", "Houston", "TX", "BASIC"),
+    (1005, "Charlie", "Brown", "charlie.brown@email.com", "555-0105", "654 Maple Ave", "Phoenix", "AZ", "PREMIUM"),
+)
+# (effective_start_date, effective_end_date, is_current) shared by all initial rows
+_INITIAL_VERSION = ("2024-01-01", "9999-12-31", True)
 
 
 def get_fixtures() -> List[DEBenchFixture]:
@@ -68,78 +76,21 @@ def get_fixtures() -> List[DEBenchFixture]:
                             },
                         ],
                         # Initial customer data in SCD2 format - all current records
-                        "data": [
-                            {
-                                "customer_id": 1001,
-                                "first_name": "John",
-                                "last_name": "Doe",
-                                "email": "john.doe@email.com",
-                                "phone": "555-0101",
-                                "address": "123 Main St",
-                                "city": "New York",
-                                "state": "NY",
-                                "subscription_plan": "BASIC",
-                                "effective_start_date": "2024-01-01",
-                                "effective_end_date": "9999-12-31",
-                                "is_current": True,
-                            },
-                            {
-                                "customer_id": 1002,
-                                "first_name": "Jane",
-                                "last_name": "Smith",
-                                "email": "jane.smith@email.com",
-                                "phone": "555-0102",
-                                "address": "456 Oak Ave",
-                                "city": "Los Angeles",
-                                "state": "CA",
-                                "subscription_plan": "PREMIUM",
-                                "effective_start_date": "2024-01-01",
-                                "effective_end_date": "9999-12-31",
-                                "is_current": True,
-                            },
-                            {
-                                "customer_id": 1003,
-                                "first_name": "Bob",
-                                "last_name": "Johnson",
-                                "email": "bob.johnson@email.com",
-                                "phone": "555-0103",
-                                "address": "789 Pine Rd",
-                                "city": "Chicago",
-                                "state": "IL",
-                                "subscription_plan": "ENTERPRISE",
-                                "effective_start_date": "2024-01-01",
-                                "effective_end_date": "9999-12-31",
-                                "is_current": True,
-                            },
-                            {
-                                "customer_id": 1004,
-                                "first_name": "Alice",
-                                "last_name": "Williams",
-                                "email": "alice.williams@email.com",
-                                "phone": "555-0104",
-                                "address": "321 Elm St",
-                                "city": "Houston",
-                                "state": "TX",
-                                "subscription_plan": "BASIC",
-                                "effective_start_date": "2024-01-01",
-                                "effective_end_date": "9999-12-31",
-                                "is_current": True,
-                            },
-                            {
-                                "customer_id": 1005,
-                                "first_name": "Charlie",
-                                "last_name": "Brown",
-                                "email": "charlie.brown@email.com",
-                                "phone": "555-0105",
-                                "address": "654 Maple Ave",
-                                "city": "Phoenix",
-                                "state": "AZ",
-                                "subscription_plan": "PREMIUM",
-                                "effective_start_date": "2024-01-01",
-                                "effective_end_date": "9999-12-31",
-                                "is_current": True,
-                            },
+                        "data_columns": [
+                            "customer_id",
+                            "first_name",
+                            "last_name",
+                            "email",
+                            "phone",
+                            "address",
+                            "city",
+                            "state",
+                            "subscription_plan",
+                            "effective_start_date",
+                            "effective_end_date",
+                            "is_current",
                         ],
+                        "data_rows": [customer + _INITIAL_VERSION for customer in _INITIAL_CUSTOMERS],
                     }
                 ],
             }
@@ -167,6 +118,102 @@ def create_model_inputs(
     }
 
 
+# Which of the SCD2 and staging tables exist, in one round trip for Steps 2 and 5
+_TABLES_SQL = """
+    SELECT table_name
+    FROM information_schema.tables
+    WHERE table_schema = DATABASE()
+    AND table_name IN ('customers_scd2', 'customers_staging')
+"""
+
+# Columns customers_scd2 must have for the SCD2 pattern and the business attributes
+_SCD2_REQUIRED_COLUMNS = (
+    "customer_key",
+    "customer_id",
+    "effective_start_date",
+    "effective_end_date",
+    "is_current",
+)
+_BUSINESS_COLUMNS = ("first_name", "last_name", "email")
+
+# Which of the required columns exist; the membership test runs on the server
+_REQUIRED_COLUMNS_SQL = f"""
+    SELECT column_name
+    FROM information_schema.columns
+    WHERE table_schema = DATABASE()
+    AND table_name = 'customers_scd2'
+    AND column_name IN ({", ".join(f"'{name}'" for name in _SCD2_REQUIRED_COLUMNS + _BUSINESS_COLUMNS)})
+"""
+
+# Stored procedure and view counts for Step 5 in one round trip
+_INFRASTRUCTURE_COUNTS_SQL = """
+    SELECT 'procedures', COUNT(*)
+    FROM information_schema.routines
+    WHERE routine_schema = %s
+    AND routine_type = 'PROCEDURE'
+    UNION ALL
+    SELECT 'views', COUNT(*)
+    FROM information_schema.views
+    WHERE table_schema = %s
+"""
+
+# Step 3: total, current and distinct-customer counts in one scan
+_RECORD_COUNTS_SQL = """
+    SELECT COUNT(*),
+           SUM(is_current = TRUE),
+           COUNT(DISTINCT customer_id)
+    FROM customers_scd2
+"""
+
+# Step 4: customers with more than one version and their historical versions
+_HISTORY_TOTALS_SQL = """
+    SELECT COUNT(*), COALESCE(SUM(historical_count), 0)
+    FROM (
+        SELECT SUM(CASE WHEN is_current = FALSE THEN 1 ELSE 0 END) as historical_count
+        FROM customers_scd2
+        GROUP BY customer_id
+        HAVING COUNT(*) > 1
+    ) customers_with_history
+"""
+
+# Step 4 fallback: versions that have been closed out even without a newer version
+_PROCESSED_RECORDS_SQL = """
+    SELECT COUNT(*)
+    FROM customers_scd2
+    WHERE effective_end_date != '9999-12-31' OR is_current = FALSE
+"""
+
+
+# Static (name, description, in-progress message) for each validation step
+_STEP_META = (
+    (
+        "Agent Task Execution",
+        "AI Agent executes SCD2 implementation",
+        "Checking if AI agent executed the SCD2 task...",
+    ),
+    (
+        "SCD2 Table Structure",
+        "Verify customers_scd2 table with proper SCD2 columns",
+        "Validating SCD2 table structure...",
+    ),
+    (
+        "Initial Customer Data",
+        "Verify initial customer data with current flags",
+        "Validating initial customer data...",
+    ),
+    (
+        "Historical Tracking",
+        "Verify SCD2 logic creates historical records",
+        "Validating historical record tracking...",
+    ),
+    (
+        "SCD2 Processing Logic",
+        "Verify stored procedures or views for SCD2 operations",
+        "Validating SCD2 processing infrastructure...",
+    ),
+)
+
+
 def validate_test(model_result, fixtures=None):
     """
     Validates that the AI agent successfully implemented SCD Type 2 pattern.
@@ -185,53 +232,18 @@ def validate_test(model_result, fixtures=None):
     Returns:
         dict: Contains 'score' float and 'metadata' dict with validation details
     """
-    # Create test steps for this validation
-    test_steps = [
-        {
-            "name": "Agent Task Execution",
-            "description": "AI Agent executes SCD2 implementation",
-            "status": "running",
-            "Result_Message": "Checking if AI agent executed the SCD2 task...",
-        },
-        {
-            "name": "SCD2 Table Structure",
-            "description": "Verify customers_scd2 table with proper SCD2 columns",
-            "status": "running",
-            "Result_Message": "Validating SCD2 table structure...",
-        },
-        {
-            "name": "Initial Customer Data",
-            "description": "Verify initial customer data with current flags",
-            "status": "running",
-            "Result_Message": "Validating initial customer data...",
-        },
-        {
-            "name": "Historical Tracking",
-            "description": "Verify SCD2 logic creates historical records",
-            "status": "running",
-            "Result_Message": "Validating historical record tracking...",
-        },
-        {
-            "name": "SCD2 Processing Logic",
-            "description": "Verify stored procedures or views for SCD2 operations",
-            "status": "running",
-            "Result_Message": "Validating SCD2 processing infrastructure...",
-        },
-    ]
+    # Bit i is set once step i passes; step dicts are only built in build_step_result
+    passed_mask = 0
+    messages: List[Optional[str]] = [None] * len(_STEP_META)
 
     try:
         # Step 1: Check that the agent task executed
         if not model_result or model_result.get("status") == "failed":
-            test_steps[0]["status"] = "failed"
-            test_steps[0][
-                "Result_Message"
-            ] = "❌ AI Agent task execution failed or returned no result"
-            return {"score": 0.0, "metadata": {"test_steps": test_steps}}
+            messages[0] = "❌ AI Agent task execution failed or returned no result"
+            return build_step_result(_STEP_META, passed_mask, messages)
 
-        test_steps[0]["status"] = "passed"
-        test_steps[0][
-            "Result_Message"
-        ] = "✅ AI Agent completed task execution successfully"
+        passed_mask |= 1 << 0
+        messages[0] = "✅ AI Agent completed task execution successfully"
 
         # Get MySQL fixture for validation
         mysql_fixture = None
@@ -254,156 +266,120 @@ def validate_test(model_result, fixtures=None):
 
         try:
             # Step 2: Validate SCD2 table structure
-            db_cursor.execute("SHOW TABLES LIKE 'customers_scd2'")
-            table_exists = db_cursor.fetchone()
+            # The staging table checked in Step 5 is looked up in the same query
+            db_cursor.execute(_TABLES_SQL)
+            existing_tables = {row[0] for row in db_cursor.fetchall()}
 
-            if not table_exists:
-                test_steps[1]["status"] = "failed"
-                test_steps[1]["Result_Message"] = "❌ customers_scd2 table not found"
-                return {"score": 0.2, "metadata": {"test_steps": test_steps}}
+            if "customers_scd2" not in existing_tables:
+                messages[1] = "❌ customers_scd2 table not found"
+                return build_step_result(_STEP_META, passed_mask, messages)
 
             # Check SCD2 columns
-            db_cursor.execute("DESCRIBE customers_scd2")
-            columns = {row[0]: row[1] for row in db_cursor.fetchall()}
-
-            scd2_required_columns = [
-                'customer_key', 'customer_id', 'effective_start_date', 
-                'effective_end_date', 'is_current'
-            ]
-            business_columns = ['first_name', 'last_name', 'email']
-            
-            missing_scd2_columns = [col for col in scd2_required_columns if col not in columns]
-            missing_business_columns = [col for col in business_columns if col not in columns]
+            db_cursor.execute(_REQUIRED_COLUMNS_SQL)
+            found_columns = {row[0] for row in db_cursor.fetchall()}
+
+            missing_scd2_columns = [col for col in _SCD2_REQUIRED_COLUMNS if col not in found_columns]
+            missing_business_columns = [col for col in _BUSINESS_COLUMNS if col not in found_columns]
 
             if not missing_scd2_columns and not missing_business_columns:
-                test_steps[1]["status"] = "passed"
-                test_steps[1]["Result_Message"] = f"✅ SCD2 table structure validated: {len(columns)} columns including all SCD2 fields"
+                passed_mask |= 1 << 1
+                messages[1] = (
+                    f"✅ SCD2 table structure validated: all {len(found_columns)} required "
+                    "SCD2 and business columns present"
+                )
             else:
-                test_steps[1]["status"] = "failed"
                 missing_all = missing_scd2_columns + missing_business_columns
-                test_steps[1]["Result_Message"] = f"❌ Missing required columns: {missing_all}"
-                return {"score": 0.2, "metadata": {"test_steps": test_steps}}
+                messages[1] = f"❌ Missing required columns: {missing_all}"
+                return build_step_result(_STEP_META, passed_mask, messages)
 
             # Step 3: Validate initial customer data
-            db_cursor.execute("SELECT COUNT(*) FROM customers_scd2")
-            total_records = db_cursor.fetchone()[0]
-
-            db_cursor.execute("SELECT COUNT(*) FROM customers_scd2 WHERE is_current = TRUE")
-            current_records = db_cursor.fetchone()[0]
-
-            db_cursor.execute("SELECT COUNT(DISTINCT customer_id) FROM customers_scd2")
-            unique_customers = db_cursor.fetchone()[0]
+            # All three counts come from one scan of the table
+            db_cursor.execute(_RECORD_COUNTS_SQL)
+            total_records, current_records, unique_customers = db_cursor.fetchone()
+            # SUM() is NULL on an empty table
+            current_records = int(current_records or 0)
 
             if total_records >= 5 and current_records >= 5 and unique_customers >= 5:
-                test_steps[2]["status"] = "passed"
-                test_steps[2]["Result_Message"] = (
+                passed_mask |= 1 << 2
+                messages[2] = (
                     f"✅ Initial customer data validated: {total_records} total records, "
                     f"{current_records} current records, {unique_customers} unique customers"
                 )
             else:
-                test_steps[2]["status"] = "failed"
-                test_steps[2]["Result_Message"] = (
+                messages[2] = (
                     f"❌ Insufficient customer data: {total_records} total, "
                     f"{current_records} current, {unique_customers} unique"
                 )
 
             # Step 4: Check for historical tracking evidence
             # Look for customers with multiple records (indicating SCD2 processing)
-            db_cursor.execute("""
-                SELECT customer_id, COUNT(*) as record_count,
-                       SUM(CASE WHEN is_current = TRUE THEN 1 ELSE 0 END) as current_count,
-                       SUM(CASE WHEN is_current = FALSE THEN 1 ELSE 0 END) as historical_count
-                FROM customers_scd2
-                GROUP BY customer_id
-                HAVING COUNT(*) > 1
-                ORDER BY record_count DESC
-                LIMIT 5
-            """)
-            
-            customers_with_history = db_cursor.fetchall()
-
-            if customers_with_history and len(customers_with_history) > 0:
-                test_steps[3]["status"] = "passed"
-                total_historical = sum(row[3] for row in customers_with_history)
-                test_steps[3]["Result_Message"] = (
-                    f"✅ Historical tracking validated: {len(customers_with_history)} customers "
+            # Only the totals are reported, so they are aggregated in SQL rather than
+            # fetching per-customer rows and summing them here. A customer can only
+            # have several versions if there are more records than distinct customers,
+            # so the grouped scan is skipped when the Step 3 counts rule it out
+            customers_with_history = total_historical = 0
+            if total_records > unique_customers:
+                db_cursor.execute(_HISTORY_TOTALS_SQL)
+                customers_with_history, total_historical = db_cursor.fetchone()
+
+            if customers_with_history > 0:
+                passed_mask |= 1 << 3
+                messages[3] = (
+                    f"✅ Historical tracking validated: {customers_with_history} customers "
                     f"with history, {total_historical} historical records"
                 )
+            elif not total_records:
+                # Nothing to have processed, so the fallback scan cannot find evidence either
+                messages[3] = "❌ No customer records to check for SCD2 history"
             else:
                 # Check if we have proper SCD2 structure even without processed updates
-                db_cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM customers_scd2 
-                    WHERE effective_end_date != '9999-12-31' OR is_current = FALSE
-                """)
+                db_cursor.execute(_PROCESSED_RECORDS_SQL)
                 processed_records = db_cursor.fetchone()[0]
                 
                 if processed_records > 0:
-                    test_steps[3]["status"] = "passed"
-                    test_steps[3]["Result_Message"] = f"✅ SCD2 processing evidence found: {processed_records} processed records"
+                    passed_mask |= 1 << 3
+                    messages[3] = f"✅ SCD2 processing evidence found: {processed_records} processed records"
                 else:
-                    test_steps[3]["status"] = "failed"
-                    test_steps[3]["Result_Message"] = "❌ No evidence of SCD2 processing - all records appear to be initial inserts"
+                    messages[3] = "❌ No evidence of SCD2 processing - all records appear to be initial inserts"
 
             # Step 5: Check for SCD2 processing infrastructure
             infrastructure_components = []
 
             # Check for staging table
-            db_cursor.execute("SHOW TABLES LIKE 'customers_staging'")
-            if db_cursor.fetchone():
+            if "customers_staging" in existing_tables:
                 infrastructure_components.append("staging table")
 
-            # Check for stored procedures
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.routines 
-                WHERE routine_schema = %s 
-                AND routine_type = 'PROCEDURE'
-            """, (db_name,))
-            
-            procedure_count = db_cursor.fetchone()[0]
+            # Check for stored procedures and views
+            db_cursor.execute(_INFRASTRUCTURE_COUNTS_SQL, (db_name, db_name))
+            infrastructure_counts = dict(db_cursor.fetchall())
+
+            procedure_count = infrastructure_counts["procedures"]
             if procedure_count > 0:
                 infrastructure_components.append(f"{procedure_count} stored procedures")
 
-            # Check for views
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.views 
-                WHERE table_schema = %s
-            """, (db_name,))
-            
-            view_count = db_cursor.fetchone()[0]
+            view_count = infrastructure_counts["views"]
             if view_count > 0:
                 infrastructure_components.append(f"{view_count} views")
 
             if len(infrastructure_components) >= 2:
-                test_steps[4]["status"] = "passed"
-                test_steps[4]["Result_Message"] = (
+                passed_mask |= 1 << 4
+                messages[4] = (
                     f"✅ SCD2 infrastructure implemented: {', '.join(infrastructure_components)}"
                 )
             elif len(infrastructure_components) >= 1:
-                test_steps[4]["status"] = "passed"
-                test_steps[4]["Result_Message"] = (
+                passed_mask |= 1 << 4
+                messages[4] = (
                     f"✅ Basic SCD2 infrastructure: {', '.join(infrastructure_components)}"
                 )
             else:
-                test_steps[4]["status"] = "failed"
-                test_steps[4]["Result_Message"] = "❌ No SCD2 processing infrastructure found"
+                messages[4] = "❌ No SCD2 processing infrastructure found"
 
         finally:
             db_cursor.close()
             db_connection.close()
 
     except Exception as e:
-        # Mark any unfinished steps as failed
-        for step in test_steps:
-            if step["status"] == "running":
-                step["status"] = "failed"
-                step["Result_Message"] = f"❌ Validation error: {str(e)}"
-
-    # Calculate score as the fraction of steps that passed
-    score = sum([step["status"] == "passed" for step in test_steps]) / len(test_steps)
-    return {
-        "score": score,
-        "metadata": {"test_steps": test_steps},
-    }
+        # Any unfinished steps are marked failed with the error
+        return build_step_result(_STEP_META, passed_mask, messages, error=e)
+
+    return build_step_result(_STEP_META, passed_mask, messages)
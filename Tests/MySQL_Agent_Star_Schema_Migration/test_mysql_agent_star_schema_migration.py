@@ -1,8 +1,8 @@
 # Braintrust-only MySQL test - no pytest dependencies
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
-import os
-import importlib
+from Tests._common import load_configs
+import copy
 import time
 import uuid
 import mysql.connector
@@ -10,10 +10,121 @@ from typing import List, Dict, Any
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
+
+
+# Source system tables (schema and seed rows) the agent migrates to a star schema.
+# Static across trials; only the resource and database names change per call
+_SOURCE_TABLES = [
+    {
+        "name": "sample_data",
+        "columns": [
+            {
+                "name": "id",
+                "type": "BIGINT AUTO_INCREMENT",
+                "primary_key": True,
+            },
+            {"name": "category", "type": "VARCHAR(50)"},
+            {"name": "value", "type": "DECIMAL(15,4)"},
+            {"name": "description", "type": "TEXT"},
+            {
+                "name": "created_at",
+                "type": "TIMESTAMP",
+                "default": "CURRENT_TIMESTAMP",
+            },
+        ],
+        # Business metrics data suitable for star schema transformation
+        "data_columns": ["category", "value", "description"],
+        "data_rows": [
+            ("Revenue", 125000.75, "Daily revenue from online sales"),
+            ("Revenue", 98500.25, "Daily revenue from retail stores"),
+            ("Customers", 1575.0, "New customer acquisitions"),
+            ("Orders", 2450.0, "Total orders processed"),
+            ("Inventory", 89700.75, "Current inventory value"),
+            ("Marketing", 15000.0, "Daily marketing spend"),
+            ("Support", 247.0, "Customer support tickets"),
+            ("Performance", 98.5, "System uptime percentage"),
+            ("Quality", 4.7, "Average product rating"),
+            ("Operations", 156.25, "Operational efficiency score"),
+            ("Revenue", 145000.5, "Weekend revenue spike"),
+            ("Customers", 892.0, "Customer retention count"),
+        ],
+    },
+    {
+        "name": "data_processing_log",
+        "columns": [
+            {
+                "name": "job_id",
+                "type": "INT AUTO_INCREMENT",
+                "primary_key": True,
+            },
+            {"name": "job_name", "type": "VARCHAR(100)", "not_null": True},
+            {"name": "status", "type": "ENUM('PENDING', 'RUNNING', 'COMPLETED', 'FAILED')"},
+            {"name": "start_time", "type": "TIMESTAMP"},
+            {"name": "end_time", "type": "TIMESTAMP"},
+            {"name": "records_processed", "type": "BIGINT"},
+        ],
+        # ETL job execution data suitable for fact table transformation
+        "data_columns": [
+            "job_name",
+            "status",
+            "start_time",
+            "end_time",
+            "records_processed",
+        ],
+        "data_rows": [
+            ("daily_sales_extract", "COMPLETED", "2024-09-26 08:00:00", "2024-09-26 08:45:30", 1250000),
+            ("hourly_customer_transform", "COMPLETED", "2024-09-26 09:00:00", "2024-09-26 09:15:20", 75000),
+            ("product_catalog_load", "COMPLETED", "2024-09-26 10:00:00", "2024-09-26 10:35:45", 500000),
+            ("inventory_sync", "COMPLETED", "2024-09-26 11:00:00", "2024-09-26 11:12:15", 25000),
+            ("financial_reconciliation", "FAILED", "2024-09-26 07:30:00", "2024-09-26 07:45:15", 0),
+            ("marketing_analytics", "COMPLETED", "2024-09-25 14:00:00", "2024-09-25 14:22:30", 89500),
+            ("customer_segmentation", "PENDING", None, None, None),
+        ],
+    },
+    {
+        "name": "job_metadata",
+        "columns": [
+            {
+                "name": "job_name",
+                "type": "VARCHAR(100)",
+                "primary_key": True,
+            },
+            {"name": "job_type", "type": "VARCHAR(50)", "not_null": True},
+            {"name": "job_category", "type": "VARCHAR(50)", "not_null": True},
+            {"name": "job_description", "type": "TEXT"},
+            {"name": "schedule_frequency", "type": "VARCHAR(20)"},
+            {"name": "priority", "type": "INT", "default": "5"},
+            {"name": "max_runtime_minutes", "type": "INT"},
+            {"name": "is_active", "type": "BOOLEAN", "default": "TRUE"},
+            {
+                "name": "created_date",
+                "type": "TIMESTAMP",
+                "default": "CURRENT_TIMESTAMP",
+            },
+        ],
+        # Job configuration and metadata for dimension table creation
+        "data_columns": [
+            "job_name",
+            "job_type",
+            "job_category",
+            "job_description",
+            "schedule_frequency",
+            "priority",
+            "max_runtime_minutes",
+            "is_active",
+        ],
+        "data_rows": [
+            ("daily_sales_extract", "EXTRACT", "Sales", "Extract daily sales data from transactional systems", "DAILY", 3, 60, True),
+            ("hourly_customer_transform", "TRANSFORM", "Customer", "Transform and cleanse customer data for analytics", "HOURLY", 2, 30, True),
+            ("product_catalog_load", "LOAD", "Product", "Load product catalog data into warehouse", "DAILY", 4, 45, True),
+            ("inventory_sync", "SYNC", "Inventory", "Synchronize inventory levels across systems", "HOURLY", 1, 15, True),
+            ("financial_reconciliation", "VALIDATE", "Finance", "Reconcile financial data across systems", "DAILY", 2, 30, True),
+            ("marketing_analytics", "ANALYZE", "Marketing", "Generate marketing performance analytics", "DAILY", 5, 90, True),
+            ("customer_segmentation", "ANALYZE", "Customer", "Customer segmentation and behavioral analysis", "WEEKLY", 4, 120, False),
+        ],
+    },
+]
 
 
 def get_fixtures() -> List[DEBenchFixture]:
@@ -32,203 +143,8 @@ def get_fixtures() -> List[DEBenchFixture]:
         "databases": [
             {
                 "name": f"source_system_db_{test_timestamp}_{test_uuid}",
-                "tables": [
-                    {
-                        "name": "sample_data",
-                        "columns": [
-                            {
-                                "name": "id",
-                                "type": "BIGINT AUTO_INCREMENT",
-                                "primary_key": True,
-                            },
-                            {"name": "category", "type": "VARCHAR(50)"},
-                            {"name": "value", "type": "DECIMAL(15,4)"},
-                            {"name": "description", "type": "TEXT"},
-                            {
-                                "name": "created_at",
-                                "type": "TIMESTAMP",
-                                "default": "CURRENT_TIMESTAMP",
-                            },
-                        ],
-                        # Business metrics data suitable for star schema transformation
-                        "data": [
-                            {"category": "Revenue", "value": 125000.75, "description": "Daily revenue from online sales"},
-                            {"category": "Revenue", "value": 98500.25, "description": "Daily revenue from retail stores"},
-                            {"category": "Customers", "value": 1575.00, "description": "New customer acquisitions"},
-                            {"category": "Orders", "value": 2450.00, "description": "Total orders processed"},
-                            {"category": "Inventory", "value": 89700.75, "description": "Current inventory value"},
-                            {"category": "Marketing", "value": 15000.00, "description": "Daily marketing spend"},
-                            {"category": "Support", "value": 247.00, "description": "Customer support tickets"},
-                            {"category": "Performance", "value": 98.5, "description": "System uptime percentage"},
-                            {"category": "Quality", "value": 4.7, "description": "Average product rating"},
-                            {"category": "Operations", "value": 156.25, "description": "Operational efficiency score"},
-                            {"category": "Revenue", "value": 145000.50, "description": "Weekend revenue spike"},
-                            {"category": "Customers", "value": 892.00, "description": "Customer retention count"},
-                        ],
-                    },
-                    {
-                        "name": "data_processing_log",
-                        "columns": [
-                            {
-                                "name": "job_id",
-                                "type": "INT AUTO_INCREMENT",
-                                "primary_key": True,
-                            },
-                            {"name": "job_name", "type": "VARCHAR(100)", "not_null": True},
-                            {"name": "status", "type": "ENUM('PENDING', 'RUNNING', 'COMPLETED', 'FAILED')"},
-                            {"name": "start_time", "type": "TIMESTAMP"},
-                            {"name": "end_time", "type": "TIMESTAMP"},
-                            {"name": "records_processed", "type": "BIGINT"},
-                        ],
-                        # ETL job execution data suitable for fact table transformation
-                        "data": [
-                            {
-                                "job_name": "daily_sales_extract",
-                                "status": "COMPLETED",
-                                "start_time": "2024-09-26 08:00:00",
-                                "end_time": "2024-09-26 08:45:30",
-                                "records_processed": 1250000,
-                            },
-                            {
-                                "job_name": "hourly_customer_transform",
-                                "status": "COMPLETED", 
-                                "start_time": "2024-09-26 09:00:00",
-                                "end_time": "2024-09-26 09:15:20",
-                                "records_processed": 75000,
-                            },
-                            {
-                                "job_name": "product_catalog_load",
-                                "status": "COMPLETED",
-                                "start_time": "2024-09-26 10:00:00",
-                                "end_time": "2024-09-26 10:35:45",
-                                "records_processed": 500000,
-                            },
-                            {
-                                "job_name": "inventory_sync",
-                                "status": "COMPLETED",
-                                "start_time": "2024-09-26 11:00:00",
-                                "end_time": "2024-09-26 11:12:15",
-                                "records_processed": 25000,
-                            },
-                            {
-                                "job_name": "financial_reconciliation",
-                                "status": "FAILED",
-                                "start_time": "2024-09-26 07:30:00",
-                                "end_time": "2024-09-26 07:45:15",
-                                "records_processed": 0,
-                            },
-                            {
-                                "job_name": "marketing_analytics",
-                                "status": "COMPLETED",
-                                "start_time": "2024-09-25 14:00:00",
-                                "end_time": "2024-09-25 14:22:30",
-                                "records_processed": 89500,
-                            },
-                            {
-                                "job_name": "customer_segmentation",
-                                "status": "PENDING",
-                                "start_time": None,
-                                "end_time": None,
-                                "records_processed": None,
-                            },
-                        ],
-                    },
-                    {
-                        "name": "job_metadata",
-                        "columns": [
-                            {
-                                "name": "job_name",
-                                "type": "VARCHAR(100)",
-                                "primary_key": True,
-                            },
-                            {"name": "job_type", "type": "VARCHAR(50)", "not_null": True},
-                            {"name": "job_category", "type": "VARCHAR(50)", "not_null": True},
-                            {"name": "job_description", "type": "TEXT"},
-                            {"name": "schedule_frequency", "type": "VARCHAR(20)"},
-                            {"name": "priority", "type": "INT", "default": "5"},
-                            {"name": "max_runtime_minutes", "type": "INT"},
-                            {"name": "is_active", "type": "BOOLEAN", "default": "TRUE"},
-                            {
-                                "name": "created_date",
-                                "type": "TIMESTAMP",
-                                "default": "CURRENT_TIMESTAMP",
-                            },
-                        ],
-                        # Job configuration and metadata for dimension table creation
-                        "data": [
-                            {
-                                "job_name": "daily_sales_extract",
-                                "job_type": "EXTRACT",
-                                "job_category": "Sales",
-                                "job_description": "Extract daily sales data from transactional systems",
-                                "schedule_frequency": "DAILY",
-                                "priority": 3,
-                                "max_runtime_minutes": 60,
-                                "is_active": True,
-                            },
-                            {
-                                "job_name": "hourly_customer_transform",
-                                "job_type": "TRANSFORM",
-                                "job_category": "Customer",
-                                "job_description": "Transform and cleanse customer data for analytics",
-                                "schedule_frequency": "HOURLY",
-                                "priority": 2,
-                                "max_runtime_minutes": 30,
-                                "is_active": True,
-                            },
-                            {
-                                "job_name": "product_catalog_load",
-                                "job_type": "LOAD",
-                                "job_category": "Product",
-                                "job_description": "Load product catalog data into warehouse",
-                                "schedule_frequency": "DAILY",
-                                "priority": 4,
-                                "max_runtime_minutes": 45,
-                                "is_active": True,
-                            },
-                            {
-                                "job_name": "inventory_sync",
-                                "job_type": "SYNC",
-                                "job_category": "Inventory",
-                                "job_description": "Synchronize inventory levels across systems",
-                                "schedule_frequency": "HOURLY",
-                                "priority": 1,
-                                "max_runtime_minutes": 15,
-                                "is_active": True,
-                            },
-                            {
-                                "job_name": "financial_reconciliation",
-                                "job_type": "VALIDATE",
-                                "job_category": "Finance",
-                                "job_description": "Reconcile financial data across systems",
-                                "schedule_frequency": "DAILY",
-                                "priority": 2,
-                                "max_runtime_minutes": 30,
-                                "is_active": True,
-                            },
-                            {
-                                "job_name": "marketing_analytics",
-                                "job_type": "ANALYZE",
-                                "job_category": "Marketing",
-                                "job_description": "Generate marketing performance analytics",
-                                "schedule_frequency": "DAILY",
-                                "priority": 5,
-                                "max_runtime_minutes": 90,
-                                "is_active": True,
-                            },
-                            {
-                                "job_name": "customer_segmentation",
-                                "job_type": "ANALYZE",
-                                "job_category": "Customer",
-                                "job_description": "Customer segmentation and behavioral analysis",
-                                "schedule_frequency": "WEEKLY",
-                                "priority": 4,
-                                "max_runtime_minutes": 120,
-                                "is_active": False,
-                            },
-                        ],
-                    },
-                ],
+                # Copied per call so a fixture can never alter the shared template
+                "tables": copy.deepcopy(_SOURCE_TABLES),
             }
         ],
     }
@@ -254,6 +170,82 @@ def create_model_inputs(
     }
 
 
+# Schemas that are never the agent's warehouse
+_SYSTEM_SCHEMAS = ("information_schema", "performance_schema", "mysql", "sys")
+
+# Every schema that could be the agent's warehouse; the system schemas and the
+# source database (the last parameter) are excluded on the server
+_Q_CANDIDATE_SCHEMAS = f"""
+    SELECT schema_name
+    FROM information_schema.schemata
+    WHERE schema_name NOT IN ({", ".join(f"'{name}'" for name in _SYSTEM_SCHEMAS)}, %s)
+    ORDER BY schema_name
+"""
+
+# Name fragments that mark a new schema as the warehouse when it is not 'data_warehouse'
+_WAREHOUSE_NAME_HINTS = ("warehouse", "star", "dim")
+
+# Audit/lineage column name patterns. They are bound as parameters: a literal
+# such as '%source%' would otherwise be mistaken for a %s placeholder.
+_AUDIT_COLUMN_PATTERNS = ("%created%", "%updated%", "%source%", "%lineage%")
+
+# Warehouse metadata snapshot in one round trip. Rows are
+# (kind, table_name, name, count):
+# - 'table': a base table, for the structure check (Step 3)
+# - 'index': a secondary index and its column count, for the fact-table index
+#   check (Step 4) and the schema-wide index count (Step 5)
+# - 'foreign_key': a referencing column, for the fact-table key check (Step 4)
+# - 'surrogate_key': a table whose primary key includes a *_key or *_id
+#   column, for the dimension surrogate key check (Step 4)
+# - 'audit_columns': a table with audit/lineage columns, for Step 5
+# - 'views' / 'procedures': schema-wide counts for Step 5
+_Q_WAREHOUSE_SNAPSHOT = """
+    SELECT 'table', table_name, NULL, NULL
+    FROM information_schema.tables 
+    WHERE table_schema = %s 
+    AND table_type = 'BASE TABLE'
+    UNION ALL
+    SELECT 'index', table_name, index_name, COUNT(*) 
+    FROM information_schema.statistics 
+    WHERE table_schema = %s 
+    AND index_name != 'PRIMARY'
+    GROUP BY table_name, index_name
+    UNION ALL
+    SELECT 'foreign_key', table_name, column_name, NULL
+    FROM information_schema.KEY_COLUMN_USAGE 
+    WHERE table_schema = %s 
+    AND REFERENCED_TABLE_NAME IS NOT NULL
+    UNION ALL
+    SELECT DISTINCT 'surrogate_key', table_name, NULL, NULL
+    FROM information_schema.COLUMNS 
+    WHERE table_schema = %s 
+    AND (COLUMN_NAME LIKE '%_key' OR COLUMN_NAME LIKE '%_id')
+    AND COLUMN_KEY = 'PRI'
+    UNION ALL
+    SELECT 'audit_columns', table_name, NULL, COUNT(*) 
+    FROM information_schema.COLUMNS 
+    WHERE table_schema = %s 
+    AND (COLUMN_NAME LIKE %s OR COLUMN_NAME LIKE %s 
+         OR COLUMN_NAME LIKE %s OR COLUMN_NAME LIKE %s)
+    GROUP BY table_name
+    UNION ALL
+    SELECT 'views', NULL, NULL, COUNT(*) 
+    FROM information_schema.views 
+    WHERE table_schema = %s
+    UNION ALL
+    SELECT 'procedures', NULL, NULL, COUNT(*) 
+    FROM information_schema.routines 
+    WHERE routine_schema = %s 
+    AND routine_type = 'PROCEDURE'
+    ORDER BY 2
+"""
+
+
+def _quote_identifier(name: str) -> str:
+    """Backtick-quote a MySQL identifier, so agent-chosen names are used verbatim."""
+    return "`" + name.replace("`", "``") + "`"
+
+
 def validate_test(model_result, fixtures=None):
     """
     Validates that the AI agent successfully implemented a star schema migration.
@@ -339,64 +331,40 @@ def validate_test(model_result, fixtures=None):
         source_db_name = resource_data["created_resources"][0]["name"]
         if not source_db_name:
             raise Exception("Source database name not available")
-            
+
+        # Only reached once Step 1 has passed: a failed or empty agent run returns
+        # above without taking a connection from the pool
         db_connection = mysql_fixture.get_connection()  # Connect without specific database
         db_cursor = db_connection.cursor()
 
         try:
             # Step 2: Check if new data warehouse was created
-            print(f"DEBUG: About to execute first query")
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.schemata 
-                WHERE schema_name = 'data_warehouse'
-            """)
-            data_warehouse_exists = db_cursor.fetchone()[0] > 0
-            print(f"DEBUG: First query completed, data_warehouse_exists={data_warehouse_exists}")
-
-            if data_warehouse_exists:
+            # One schemata listing, classified in Python, replaces the exact-name,
+            # warehouse-like and any-new-schema lookups
+            db_cursor.execute(_Q_CANDIDATE_SCHEMAS, (source_db_name,))
+            new_schemas = [row[0] for row in db_cursor.fetchall()]
+            warehouse_schemas = [
+                name for name in new_schemas if any(hint in name.lower() for hint in _WAREHOUSE_NAME_HINTS)
+            ]
+
+            if "data_warehouse" in new_schemas:
                 test_steps[1]["status"] = "passed"
                 test_steps[1]["Result_Message"] = "✅ Data warehouse 'data_warehouse' created successfully"
                 target_schema = "data_warehouse"
+            elif warehouse_schemas:
+                # Also accept a new database with a warehouse-like name
+                test_steps[1]["status"] = "passed"
+                target_schema = warehouse_schemas[0]
+                test_steps[1]["Result_Message"] = f"✅ Data warehouse '{target_schema}' created successfully"
+            elif new_schemas:
+                # Fall back to any new schema at all
+                test_steps[1]["status"] = "passed"
+                target_schema = new_schemas[0]
+                test_steps[1]["Result_Message"] = f"✅ New database '{target_schema}' created"
             else:
-                # Also check for any new database that was created (might have different name)
-                print(f"DEBUG: About to execute warehouse query with source_db_name='{source_db_name}'")
-                db_cursor.execute("""
-                    SELECT schema_name 
-                    FROM information_schema.schemata 
-                    WHERE schema_name NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys', %s)
-                    AND (schema_name LIKE '%warehouse%' OR schema_name LIKE '%star%' OR schema_name LIKE '%dim%')
-                """, (source_db_name,))
-                print(f"DEBUG: Warehouse query completed")
-                warehouse_schemas = db_cursor.fetchall()
-
-                if warehouse_schemas:
-                    test_steps[1]["status"] = "passed"
-                    target_schema = warehouse_schemas[0][0]
-                    if not target_schema:
-                        raise Exception("Target schema name is empty")
-                    test_steps[1]["Result_Message"] = f"✅ Data warehouse '{target_schema}' created successfully"
-                else:
-                    # Check for any new schema at all
-                    print(f"DEBUG: About to execute any_new_schemas query with source_db_name='{source_db_name}'")
-                    db_cursor.execute("""
-                        SELECT schema_name 
-                        FROM information_schema.schemata 
-                        WHERE schema_name NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys', %s)
-                    """, (source_db_name,))
-                    print(f"DEBUG: Any new schemas query completed")
-                    any_new_schemas = db_cursor.fetchall()
-                    
-                    if any_new_schemas:
-                        test_steps[1]["status"] = "passed"
-                        target_schema = any_new_schemas[0][0]
-                        if not target_schema:
-                            raise Exception("Target schema name is empty")
-                        test_steps[1]["Result_Message"] = f"✅ New database '{target_schema}' created"
-                    else:
-                        test_steps[1]["status"] = "failed"
-                        test_steps[1]["Result_Message"] = "❌ No new data warehouse database created"
-                        return {"score": 0.2, "metadata": {"test_steps": test_steps}}
+                test_steps[1]["status"] = "failed"
+                test_steps[1]["Result_Message"] = "❌ No new data warehouse database created"
+                return {"score": 0.2, "metadata": {"test_steps": test_steps}}
 
             # Step 3: Validate star schema structure
             # Check for fact and dimension tables
@@ -404,22 +372,59 @@ def validate_test(model_result, fixtures=None):
                 raise Exception("Target schema not properly defined")
             
             print(f"DEBUG: About to execute tables query with target_schema='{target_schema}'")
-            db_cursor.execute("""
-                SELECT table_name, table_rows 
-                FROM information_schema.tables 
-                WHERE table_schema = %s 
-                AND table_type = 'BASE TABLE'
-                ORDER BY table_name
-            """, (target_schema,))
+            db_cursor.execute(
+                _Q_WAREHOUSE_SNAPSHOT,
+                (target_schema,) * 5 + _AUDIT_COLUMN_PATTERNS + (target_schema,) * 2,
+            )
             print(f"DEBUG: Tables query completed")
-            all_tables = db_cursor.fetchall()
-            table_names = [table[0] for table in all_tables]
+            table_names = []
+            # Fact, dimension and time-dimension tables are recognised by name,
+            # classified in the same pass that collects the table names
+            fact_tables = []
+            dim_tables = []
+            time_dim_tables = []
+            secondary_indexes = []
+            foreign_key_tables = []
+            surrogate_key_tables = set()
+            audit_column_tables = set()
+            schema_counts = {}
+            for kind, table_name, name, count in db_cursor.fetchall():
+                if kind == "table":
+                    table_names.append(table_name)
+                    lowered_name = table_name.lower()
+                    if "fact" in lowered_name:
+                        fact_tables.append(table_name)
+                    if "dim" in lowered_name:
+                        dim_tables.append(table_name)
+                    if "time" in lowered_name:
+                        time_dim_tables.append(table_name)
+                elif kind == "index":
+                    secondary_indexes.append((table_name, name, count))
+                elif kind == "foreign_key":
+                    foreign_key_tables.append(table_name)
+                elif kind == "surrogate_key":
+                    surrogate_key_tables.add(table_name)
+                elif kind == "audit_columns":
+                    audit_column_tables.add(table_name)
+                else:
+                    schema_counts[kind] = count
 
-            # Look for fact table
-            fact_tables = [name for name in table_names if 'fact' in name.lower()]
-            
-            # Look for dimension tables
-            dim_tables = [name for name in table_names if 'dim' in name.lower()]
+            # Exact row counts for the fact table (Step 4) and the time dimension
+            # (Step 5), one COUNT(*) branch per table in a single round trip
+            row_counts = {}
+            counted_tables = list(dict.fromkeys(fact_tables[:1] + time_dim_tables[:1]))
+            if counted_tables:
+                try:
+                    db_cursor.execute(
+                        " UNION ALL ".join(
+                            f"SELECT %s, COUNT(*) FROM {_quote_identifier(target_schema)}.{_quote_identifier(table_name)}"
+                            for table_name in counted_tables
+                        ),
+                        counted_tables,
+                    )
+                    row_counts = dict(db_cursor.fetchall())
+                except mysql.connector.Error as e:
+                    print(f"Warning: Could not count star-schema rows: {e}")
 
             star_schema_score = 0
             star_schema_details = []
@@ -440,10 +445,10 @@ def validate_test(model_result, fixtures=None):
                     f"✅ Star schema structure validated: {', '.join(star_schema_details)} "
                     f"(Tables: {', '.join(table_names)})"
                 )
-            elif len(all_tables) >= 4:  # At least have some tables that could be star schema
+            elif len(table_names) >= 4:  # At least have some tables that could be star schema
                 test_steps[2]["status"] = "passed"
                 test_steps[2]["Result_Message"] = (
-                    f"✅ Multi-table structure created: {len(all_tables)} tables "
+                    f"✅ Multi-table structure created: {len(table_names)} tables "
                     f"(Tables: {', '.join(table_names)})"
                 )
             else:
@@ -459,63 +464,31 @@ def validate_test(model_result, fixtures=None):
             # Check for foreign key constraints in fact table
             if fact_tables:
                 fact_table = fact_tables[0]
-                db_cursor.execute("""
-                    SELECT 
-                        COLUMN_NAME,
-                        REFERENCED_TABLE_NAME,
-                        REFERENCED_COLUMN_NAME
-                    FROM information_schema.KEY_COLUMN_USAGE 
-                    WHERE table_schema = %s 
-                    AND table_name = %s
-                    AND REFERENCED_TABLE_NAME IS NOT NULL
-                """, (target_schema, fact_table))
-                
-                foreign_keys = db_cursor.fetchall()
-                if foreign_keys:
-                    relationship_checks.append(f"{len(foreign_keys)} foreign keys in fact table")
+                fact_foreign_keys = foreign_key_tables.count(fact_table)
+                if fact_foreign_keys:
+                    relationship_checks.append(f"{fact_foreign_keys} foreign keys in fact table")
                 
                 # Check if fact table has data
-                try:
-                    db_cursor.execute(f"SELECT COUNT(*) FROM {target_schema}.{fact_table}")
-                    fact_count = db_cursor.fetchone()[0]
-                    if fact_count > 0:
-                        relationship_checks.append(f"{fact_count} records in fact table")
-                except Exception:
-                    pass
+                fact_count = row_counts.get(fact_table, 0)
+                if fact_count > 0:
+                    relationship_checks.append(f"{fact_count} records in fact table")
 
             # Check for surrogate keys in dimension tables
-            surrogate_key_count = 0
-            for dim_table in dim_tables:
-                try:
-                    # Look for columns ending with '_key' or '_id' that might be surrogate keys
-                    db_cursor.execute("""
-                        SELECT COLUMN_NAME 
-                        FROM information_schema.COLUMNS 
-                        WHERE table_schema = %s 
-                        AND table_name = %s
-                        AND (COLUMN_NAME LIKE '%_key' OR COLUMN_NAME LIKE '%_id')
-                        AND COLUMN_KEY = 'PRI'
-                    """, (target_schema, dim_table))
-                    
-                    surrogate_keys = db_cursor.fetchall()
-                    if surrogate_keys:
-                        surrogate_key_count += 1
-                except Exception:
-                    pass
-            
+            # (primary key columns ending with '_key' or '_id', from the snapshot)
+            surrogate_key_count = sum(dim_table in surrogate_key_tables for dim_table in dim_tables)
             if surrogate_key_count > 0:
                 relationship_checks.append(f"{surrogate_key_count} dimension tables with surrogate keys")
 
-            # Check for proper indexing on fact table
+            # Check for proper indexing on fact table (one count per indexed column,
+            # as SHOW INDEX reports them)
             if fact_tables:
-                try:
-                    db_cursor.execute(f"SHOW INDEX FROM {target_schema}.{fact_tables[0]}")
-                    indexes = db_cursor.fetchall()
-                    non_primary_indexes = [idx for idx in indexes if idx[2] != 'PRIMARY']
-                    if non_primary_indexes:
-                        relationship_checks.append(f"{len(non_primary_indexes)} indexes on fact table")
-                except Exception:
-                    pass
+                fact_index_columns = sum(
+                    column_count
+                    for table_name, _, column_count in secondary_indexes
+                    if table_name == fact_tables[0]
+                )
+                if fact_index_columns:
+                    relationship_checks.append(f"{fact_index_columns} indexes on fact table")
 
             # Evaluate relationship checks
             if len(relationship_checks) >= 3:
@@ -536,70 +509,30 @@ def validate_test(model_result, fixtures=None):
             analytics_components = []
 
             # Check for analytical views in the new schema
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.views 
-                WHERE table_schema = %s
-            """, (target_schema,))
-            
-            view_count = db_cursor.fetchone()[0]
+            view_count = schema_counts["views"]
             if view_count > 0:
                 analytics_components.append(f"{view_count} analytical views")
 
             # Check for stored procedures for data warehouse maintenance
-            db_cursor.execute("""
-                SELECT COUNT(*) 
-                FROM information_schema.routines 
-                WHERE routine_schema = %s 
-                AND routine_type = 'PROCEDURE'
-            """, (target_schema,))
-            
-            procedure_count = db_cursor.fetchone()[0]
+            procedure_count = schema_counts["procedures"]
             if procedure_count > 0:
                 analytics_components.append(f"{procedure_count} maintenance procedures")
 
             # Check for proper indexing across all tables
-            db_cursor.execute("""
-                SELECT COUNT(DISTINCT index_name) 
-                FROM information_schema.statistics 
-                WHERE table_schema = %s 
-                AND index_name != 'PRIMARY'
-            """, (target_schema,))
-            
-            index_count = db_cursor.fetchone()[0]
-            if index_count >= len(all_tables):  # At least one index per table
+            index_count = len({index_name for _, index_name, _ in secondary_indexes})
+            if index_count >= len(table_names):  # At least one index per table
                 analytics_components.append(f"{index_count} performance indexes")
 
             # Check for time dimension data (if dim_time table exists)
-            time_dim_tables = [name for name in table_names if 'time' in name.lower()]
             if time_dim_tables:
-                try:
-                    db_cursor.execute(f"SELECT COUNT(*) FROM {target_schema}.{time_dim_tables[0]}")
-                    time_records = db_cursor.fetchone()[0]
-                    if time_records >= 30:  # At least a month of time dimension data
-                        analytics_components.append(f"time dimension with {time_records} records")
-                except Exception:
-                    pass
+                time_records = row_counts.get(time_dim_tables[0], 0)
+                if time_records >= 30:  # At least a month of time dimension data
+                    analytics_components.append(f"time dimension with {time_records} records")
 
             # Check for audit/lineage columns in tables
-            audit_columns_found = 0
-            for table_name in table_names[:3]:  # Check first 3 tables
-                try:
-                    db_cursor.execute("""
-                        SELECT COUNT(*) 
-                        FROM information_schema.COLUMNS 
-                        WHERE table_schema = %s 
-                        AND table_name = %s
-                        AND (COLUMN_NAME LIKE '%created%' OR COLUMN_NAME LIKE '%updated%' 
-                             OR COLUMN_NAME LIKE '%source%' OR COLUMN_NAME LIKE '%lineage%')
-                    """, (target_schema, table_name))
-                    
-                    audit_cols = db_cursor.fetchone()[0]
-                    if audit_cols > 0:
-                        audit_columns_found += 1
-                except Exception:
-                    pass
-            
+            audit_columns_found = sum(
+                table_name in audit_column_tables for table_name in table_names[:3]  # Check first 3 tables
+            )
             if audit_columns_found >= 2:
                 analytics_components.append("audit/lineage tracking")
 
@@ -1,18 +1,14 @@
 # Braintrust-only MySQL test - no pytest dependencies
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
-import os
-import importlib
+from Tests._common import load_configs
 import time
 import mysql.connector
 from typing import List, Dict, Any
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
 
 
 def get_fixtures() -> List[DEBenchFixture]:
@@ -51,27 +47,12 @@ def get_fixtures() -> List[DEBenchFixture]:
                                 "default": "CURRENT_TIMESTAMP",
                             },
                         ],
-                        "data": [
-                            {
-                                "name": "John Doe",
-                                "email": "john@example.com",
-                                "age": 32,
-                            },
-                            {
-                                "name": "Jane Smith",
-                                "email": "jane@example.com",
-                                "age": 25,
-                            },
-                            {
-                                "name": "Bob Johnson",
-                                "email": "bob@example.com",
-                                "age": 38,
-                            },
-                            {
-                                "name": "Carol White",
-                                "email": "carol@example.com",
-                                "age": 29,
-                            },
+                        "data_columns": ["name", "email", "age"],
+                        "data_rows": [
+                            ("John Doe", "john@example.com", 32),
+                            ("Jane Smith", "jane@example.com", 25),
+                            ("Bob Johnson", "bob@example.com", 38),
+                            ("Carol White", "carol@example.com", 29),
                         ],
                     }
                 ],
@@ -1,8 +1,8 @@
 # Braintrust-only PostgreSQL test - no pytest dependencies
 from model.Run_Model import run_model
 from model.Configure_Model import set_up_model_configs, cleanup_model_artifacts
-import os
-import importlib
+from Tests._common import load_configs
+import json
 import time
 import psycopg2
 import uuid
@@ -10,10 +10,7 @@ from typing import List, Dict, Any
 from Fixtures.base_fixture import DEBenchFixture
 
 # Dynamic config loading
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir_name = os.path.basename(current_dir)
-module_path = f"Tests.{parent_dir_name}.Test_Configs"
-Test_Configs = importlib.import_module(module_path)
+Test_Configs = load_configs(__file__)
 
 # Generate unique identifiers for parallel test execution
 test_timestamp = int(time.time())
@@ -60,6 +57,13 @@ def create_model_inputs(
     }
 
 
+def _plan_uses_index(plan_node: Dict[str, Any]) -> bool:
+    """Return True if this EXPLAIN (FORMAT JSON) plan node or any child node scans an index."""
+    if "Index" in plan_node.get("Node Type", ""):
+        return True
+    return any(_plan_uses_index(child) for child in plan_node.get("Plans", ()))
+
+
 def validate_test(model_result, fixtures=None):
     """
     Validates that the AI agent successfully implemented JSONB ingestion with schema evolution.
@@ -238,7 +242,13 @@ def validate_test(model_result, fixtures=None):
                     WHERE product_data @> '{"category": "Electronics"}'
                 """)
                 query_plan = db_cursor.fetchone()
-                uses_index = 'Index' in str(query_plan) if query_plan else False
+                # psycopg2 decodes the json column already; older servers/drivers may hand back text
+                plan = query_plan[0] if query_plan else None
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                # Walk the node types (Index Scan, Bitmap Index Scan, ...) rather than
+                # substring-matching the whole stringified plan
+                uses_index = bool(plan) and _plan_uses_index(plan[0]["Plan"])
             except:
                 uses_index = False
             
@@ -0,0 +1,74 @@
+"""Shared helpers for the DE-Bench test modules."""
+
+import importlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# A step result message: either final text, or a (template, args) pair whose
+# str.format() is deferred until the step dicts are built
+StepMessage = Union[str, Tuple[str, Tuple[Any, ...]]]
+
+
+def parent_name(file_path: str) -> str:
+    """Return the name of the test directory containing `file_path`."""
+    return Path(file_path).parent.name
+
+
+def load_test_configs(test_name: str):
+    """
+    Return the Test_Configs module of the test directory `test_name`.
+
+    The module is only executed on first import; later calls are served from sys.modules.
+    """
+    return importlib.import_module(f"Tests.{test_name}.Test_Configs")
+
+
+def load_configs(file_path: str):
+    """Return the Test_Configs module next to `file_path`."""
+    return load_test_configs(parent_name(file_path))
+
+
+def build_step_result(
+    step_meta: Sequence[Tuple[str, str, str]],
+    passed_mask: int,
+    messages: List[Optional[StepMessage]],
+    error: Optional[Exception] = None,
+) -> Dict[str, Any]:
+    """
+    Materialize the test_steps dicts and score from a validation's step state.
+
+    `step_meta` holds the static (name, description, in-progress message) of each
+    step. A step whose bit is set in passed_mask passed; a step with a message but
+    no bit failed; a step with neither never finished and fails with `error` if
+    one occurred. (template, args) messages are formatted here.
+    """
+    test_steps = []
+    for i, (name, description, running_message) in enumerate(step_meta):
+        message = messages[i]
+        if isinstance(message, tuple):
+            template, args = message
+            message = template.format(*args)
+        if passed_mask >> i & 1:
+            status = "passed"
+        elif message is not None:
+            status = "failed"
+        elif error is not None:
+            status = "failed"
+            message = f"❌ Validation error: {str(error)}"
+        else:
+            status = "running"
+            message = running_message
+        test_steps.append(
+            {
+                "name": name,
+                "description": description,
+                "status": status,
+                "Result_Message": message,
+            }
+        )
+
+    # Score is the fraction of steps that passed
+    return {
+        "score": passed_mask.bit_count() / len(step_meta),
+        "metadata": {"test_steps": test_steps},
+    }
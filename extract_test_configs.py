@@ -6,6 +6,7 @@ import uuid
 from typing import Dict, List, Any, Optional, Union, Tuple
 from typing_extensions import TypedDict, NotRequired
 from Fixtures.Supabase_Account.supabase_account_resource import supabase_client
+from Tests._common import load_test_configs
 import requests
 import jwt
 from braintrust import traced
@@ -66,9 +67,8 @@ class SupabaseAccountResource(TypedDict):
 def extract_test_configuration(test_name: str) -> TestConfiguration:
     """Generic test configuration extraction for any test following the standard pattern"""
     try:
-        # Dynamically import the test config
-        config_module_path = f"Tests.{test_name}.Test_Configs"
-        Test_Configs = importlib.import_module(config_module_path)
+        # Dynamically import the test config (shared with the test modules' own lookup)
+        Test_Configs = load_test_configs(test_name)
 
         # Check if the test provides its own fixtures
         resource_configs = {}
@@ -23,6 +23,7 @@ from braintrust import traced
 from pydantic import BaseModel, validate_call
 import traceback
 from utils import map_func
+from Tests._common import load_test_configs
 
 # Note: set_up_model_configs and cleanup_model_artifacts are now used inside run_de_bench_task
 
@@ -462,8 +463,7 @@ def _is_valid_new_pattern_test(test_name: str) -> bool:
 
     try:
         # Check if Test_Configs.py exists and has User_Input
-        config_module_path = f"Tests.{test_name}.Test_Configs"
-        config_module = importlib.import_module(config_module_path)
+        config_module = load_test_configs(test_name)
 
         if not hasattr(config_module, "User_Input"):
             return False